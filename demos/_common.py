@@ -0,0 +1,63 @@
+"""
+Shared scaffolding for the logistics demos.
+Demos differ only in their objects, initial state, goals and output; the
+problem skeleton and the command line are built here for all of them.
+"""
+
+import argparse
+from itertools import chain
+from typing import Dict, Tuple
+
+from unified_planning.shortcuts import Object, Problem
+
+from src.actions import LogisticsActions
+from src.domain import LogisticsDomain
+
+def new_problem(name: str, domain: LogisticsDomain, robots: int, docks: int, containers: int,
+                piles: int) -> Tuple[Problem, Tuple[tuple, tuple, tuple, tuple], Dict[str, list]]:
+    """
+    Create a problem with numbered objects, every domain fluent and the domain's actions.
+
+    Objects are named r1.., d1.., c1.. and p1.. and are also assigned to the
+    domain, where the actions and the display utilities look them up.
+
+    Args:
+        name: Problem name
+        domain: The demo's domain
+        robots, docks, containers, piles: Number of objects of each kind
+
+    Returns:
+        The problem, the (robots, docks, containers, piles) object tuples and
+        the domain_objects dict the display utilities expect
+    """
+    problem = Problem(name)
+    kinds = ((robots, "r", domain.Robot), (docks, "d", domain.Dock),
+             (containers, "c", domain.Container), (piles, "p", domain.Pile))
+    objects = tuple(tuple(Object(f"{prefix}{i}", kind) for i in range(1, count + 1)) for count, prefix, kind in kinds)
+
+    all_objects = [obj for group in objects for obj in group]
+    problem.add_objects(all_objects)
+    domain_objects = {
+        "robots": list(objects[0]),
+        "docks": list(objects[1]),
+        "containers": list(objects[2]),
+        "piles": list(objects[3]),
+        "all_objects": all_objects
+    }
+    domain.assign_objects(domain_objects)
+
+    for fluent in chain(domain.fluents, domain.static_fluents):
+        problem.add_fluent(fluent, default_initial_value=False)
+
+    for action in LogisticsActions(domain).get_actions():
+        problem.add_action(action)
+
+    return problem, objects, domain_objects
+
+
+def parse_demo_args(description: str) -> argparse.Namespace:
+    """Parse the command line shared by every demo: --quiet and --plain."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--quiet", action="store_true", help="Suppress console output (also enabled by LOGISTICS_QUIET)")
+    parser.add_argument("--plain", action="store_true", help="Skip the rich tables and print only the plan as plain text")
+    return parser.parse_args()
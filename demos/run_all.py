@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Run all demos concurrently and summarize the results.
+Each demo solves in its own worker process, so the single-threaded Fast
+Downward runs overlap instead of queueing behind one another.
+"""
+
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Demo name -> (module in demos/, solve function returning (success, steps))
+DEMOS = {
+    "tricky_swapping": ("tricky_swapping", "solve_tricky_swapping_refactored"),
+    "tricky_weight_arrangement": ("tricky_weight_arrangement", "solve_refactored"),
+}
+
+
+def run_demo(module_name: str, function_name: str):
+    """Import a demo in the worker and run its solve function quietly; returns (success, steps, seconds)."""
+    from unified_planning.shortcuts import get_environment
+    get_environment().credits_stream = None
+
+    solve = getattr(importlib.import_module(module_name), function_name)
+    start = time.perf_counter_ns()
+    success, steps = solve(verbose=False)
+    return success, steps, (time.perf_counter_ns() - start) / 1e9
+
+
+def main():
+    # Workers print nothing; interleaved rich output from parallel demos is unreadable
+    os.environ["LOGISTICS_QUIET"] = "1"
+
+    start = time.perf_counter_ns()
+    with ProcessPoolExecutor(max_workers=min(len(DEMOS), os.cpu_count() or 1)) as pool:
+        futures = {name: pool.submit(run_demo, *target) for name, target in DEMOS.items()}
+        results = {name: future.result() for name, future in futures.items()}
+    elapsed = (time.perf_counter_ns() - start) / 1e9
+
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="📊 Demo Results", show_header=True, header_style="bold cyan")
+    table.add_column("Demo", style="cyan")
+    table.add_column("Status", style="white")
+    table.add_column("Steps", style="yellow", justify="right")
+    table.add_column("Time", style="green", justify="right")
+    for name, (success, steps, seconds) in results.items():
+        table.add_row(name, "✅ SUCCESS" if success else "❌ FAILED", str(steps), f"{seconds:.3f}s")
+
+    console = Console()
+    console.print(table)
+    console.print(f"[bold]Wall clock: {elapsed:.3f}s[/bold]")
+
+    return all(success for success, _, _ in results.values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -3,311 +3,231 @@
 Tricky Weight Challenge (Refactored)
 - Domain remains general in src/
 - This demo constructs all objects and initial state locally
-- Expected plan length: 19 actions (same as original)
+- Shortest plan: 18 actions; the default greedy search may return a longer one
 """
 
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from unified_planning.shortcuts import *
 from unified_planning.engines.results import PlanGenerationResultStatus
-from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 import time
 
+from _common import new_problem, parse_demo_args
 from src.domain import LogisticsDomain
-from src.actions import LogisticsActions
-from utils.display import LogisticsDisplay
+from utils.display import LogisticsDisplay, make_console, print_scenario, set_quiet
+from utils.fast_downward import solve_with_fast_downward
 
 
-console = Console()
+console = make_console()
+
+# Length of the shortest plan, as found by the optimal search and the bitset BFS fallback
+OPTIMAL_PLAN_LENGTH = 18
 
 
 def build_problem_refactored():
-    # Create domain WITHOUT auto objects; we'll define state here.
+    # Create domain WITHOUT auto objects; we'll define state here
     domain = LogisticsDomain(scale="small", auto_objects=False)
-    problem = Problem("tricky_weight_challenge_refactored")
-
-    # Create objects locally
-    Robot = domain.Robot
-    Dock = domain.Dock
-    Container = domain.Container
-    Pile = domain.Pile
-
-    r1 = Object("r1", Robot)
-
-    d1 = Object("d1", Dock)
-    d2 = Object("d2", Dock)
-    d3 = Object("d3", Dock)
-
-    c1 = Object("c1", Container)
-    c2 = Object("c2", Container)
-    c3 = Object("c3", Container)
-    c4 = Object("c4", Container)
-    c5 = Object("c5", Container)
-
-    p1 = Object("p1", Pile)
-    p2 = Object("p2", Pile)
-    p3 = Object("p3", Pile)
-
-    # Register all objects with the problem AND assign to domain for action rules
-    all_objects = [r1, d1, d2, d3, c1, c2, c3, c4, c5, p1, p2, p3]
-    problem.add_objects(all_objects)
-    
-    # Assign objects to domain so actions can access them
-    domain.assign_objects({
-        "robots": [r1],
-        "docks": [d1, d2, d3],
-        "containers": [c1, c2, c3, c4, c5],
-        "piles": [p1, p2, p3],
-        "all_objects": all_objects
-    })
-
-    # Add fluents (all domain fluents and static fluents)
-    for fluent in domain.fluents + domain.static_fluents:
-        problem.add_fluent(fluent, default_initial_value=False)
-
-    # Now that domain has objects, build actions and add them
-    actions = LogisticsActions(domain)
-    for action in actions.get_actions():
-        problem.add_action(action)
+    # Objects, fluents and actions; objects are created locally for this demo
+    problem, objects, domain_objects = new_problem(
+        "tricky_weight_challenge_refactored", domain, robots=1, docks=3, containers=5, piles=3
+    )
+    (r1,), (d1, d2, d3), (c1, c2, c3, c4, c5), (p1, p2, p3) = objects
+
+    in_pile = domain.container_in_pile
 
     # Initial state (identical to original tricky_weight_challenge)
-    I = {
+    initial = {
         # Robot locations
         domain.robot_at(r1, d1): True,
 
         # Robot capacities (2 slots for r1)
-        domain.robot_can_carry_1(r1): True,
-        domain.robot_can_carry_2(r1): True,
-        domain.robot_can_carry_3(r1): False,
+        **domain.slot_capacity(r1, 2),
 
         # Weight capacity and current weight
         domain.robot_capacity_6(r1): True,
         domain.robot_weight_0(r1): True,
 
-        # Robot load tracking
-        domain.robot_has_container_1(r1): False,
-        domain.robot_has_container_2(r1): False,
-        domain.robot_has_container_3(r1): False,
-
-        # Initialize robot slot tracking (empty)
-        domain.container_in_robot_slot_1(r1, c1): False,
-        domain.container_in_robot_slot_1(r1, c2): False,
-        domain.container_in_robot_slot_1(r1, c3): False,
-        domain.container_in_robot_slot_1(r1, c4): False,
-        domain.container_in_robot_slot_1(r1, c5): False,
-
-        domain.container_in_robot_slot_2(r1, c1): False,
-        domain.container_in_robot_slot_2(r1, c2): False,
-        domain.container_in_robot_slot_2(r1, c3): False,
-        domain.container_in_robot_slot_2(r1, c4): False,
-        domain.container_in_robot_slot_2(r1, c5): False,
-
-        domain.robot_free(r1): True,
+        # Robot starts empty: slot and load-tracking fluents keep their False default,
+        # as do container_on_top_of_pile for every container that is not on top
 
         # Container weights
         domain.container_weight_2(c1): True,
-        domain.container_weight_4(c2): True,
-        domain.container_weight_4(c3): True,
-        domain.container_weight_4(c4): True,
-        domain.container_weight_4(c5): True,
+        **{domain.container_weight_4(c): True for c in (c2, c3, c4, c5)},
 
         # Piles and stacking
-        domain.container_in_pile(c1, p1): True,
-        domain.container_in_pile(c2, p1): True,
+        **{in_pile(c, p): True for c, p in ((c1, p1), (c2, p1), (c3, p2), (c4, p2), (c5, p2))},
         domain.container_on_top_of_pile(c2, p1): True,
-        domain.container_on_top_of_pile(c1, p1): False,
         domain.container_under_in_pile(c1, c2, p1): True,
 
-        domain.container_in_pile(c3, p2): True,
-        domain.container_in_pile(c4, p2): True,
-        domain.container_in_pile(c5, p2): True,
         domain.container_on_top_of_pile(c5, p2): True,
-        domain.container_on_top_of_pile(c4, p2): False,
-        domain.container_on_top_of_pile(c3, p2): False,
         domain.container_under_in_pile(c3, c4, p2): True,
         domain.container_under_in_pile(c4, c5, p2): True,
 
-        # Empty p3
-        domain.container_in_pile(c1, p3): False,
-        domain.container_in_pile(c2, p3): False,
-        domain.container_in_pile(c3, p3): False,
-        domain.container_in_pile(c4, p3): False,
-        domain.container_in_pile(c5, p3): False,
+        # p3 starts empty: no container_in_pile facts
 
         # Pile locations
         domain.pile_at_dock(p1, d1): True,
         domain.pile_at_dock(p2, d2): True,
         domain.pile_at_dock(p3, d3): True,
 
-        # Adjacency
-        domain.adjacent(d1, d2): True,
-        domain.adjacent(d2, d1): True,
-        domain.adjacent(d2, d3): True,
-        domain.adjacent(d3, d2): True,
-        domain.adjacent(d3, d1): True,
-        domain.adjacent(d1, d3): True,
+        # Adjacency: every dock pair is connected
+        **domain.connections([(d1, d2), (d2, d3), (d1, d3)]),
     }
 
-    for f, v in I.items():
+    for f, v in initial.items():
         problem.set_initial_value(f, v)
 
     # Goal conditions (identical to original)
-    goal = And(
-        domain.container_in_pile(c4, p3),
-        domain.container_in_pile(c5, p3),
-        domain.container_in_pile(c1, p3),
-        domain.container_in_pile(c2, p3),
-        domain.container_in_pile(c3, p2),
+    # Each container ends up in exactly one pile
+    target_pile = {c4: p3, c5: p3, c1: p3, c2: p3, c3: p2}
+    goals = (
+        *(in_pile(c, p) for c, p in target_pile.items()),
         domain.container_on_top_of_pile(c2, p3),
         domain.container_under_in_pile(c1, c2, p3),
         domain.container_under_in_pile(c5, c1, p3),
         domain.container_under_in_pile(c4, c5, p3),
         domain.container_on_top_of_pile(c3, p2),
     )
-    problem.add_goal(goal)
-
-    # For display utilities
-    domain_objects = {
-        "robots": [r1],
-        "docks": [d1, d2, d3],
-        "containers": [c1, c2, c3, c4, c5],
-        "piles": [p1, p2, p3],
-        "all_objects": [r1, d1, d2, d3, c1, c2, c3, c4, c5, p1, p2, p3]
-    }
+    for goal in goals:
+        problem.add_goal(goal)
 
+    # domain_objects is also what the display utilities expect
     return problem, domain, domain_objects
 
 
-def solve_refactored():
-    console.print(Panel("⚖️ Tricky Weight Challenge (Refactored)\nDomain is independent; demo builds world and state locally", title="Refactored Tricky Weight", title_align="left", border_style="blue"))
+# Initial and target distributions shown before solving (constant for this scenario)
+_INITIAL_DISTRIBUTION = {
+    "dock_distributions": [
+        {
+            "dock": "d1",
+            "pile": "p1", 
+            "containers": "c1(2t) → c2(4t)",
+            "count": 2,
+            "total_weight": "6t",
+            "robot": "r1"
+        },
+        {
+            "dock": "d2",
+            "pile": "p2",
+            "containers": "c3(4t) → c4(4t) → c5(4t)",
+            "count": 3,
+            "total_weight": "12t",
+            "robot": "-"
+        },
+        {
+            "dock": "d3", 
+            "pile": "p3",
+            "containers": "Empty",
+            "count": 0,
+            "total_weight": "0t",
+            "robot": "-"
+        }
+    ],
+    "robot_capacities": [
+        {
+            "robot": "r1",
+            "capacity": "6t",
+            "slots": "2",
+            "current_load": "0t",
+            "available": "6t (2 slots)"
+        }
+    ],
+    "summary_metrics": [
+        {
+            "name": "Total Containers",
+            "initial": 5,
+            "target": 5,
+            "change": "0"
+        },
+        {
+            "name": "Total Weight",
+            "initial": "18t",
+            "target": "18t", 
+            "change": "0"
+        },
+        {
+            "name": "Robot Capacity",
+            "initial": "6t (2 slots)",
+            "target": "6t (2 slots)", 
+            "change": "No change"
+        }
+    ]
+}
+
+_TARGET_DISTRIBUTION = {
+    "dock_distributions": [
+        {
+            "dock": "d1",
+            "pile": "p1",
+            "containers": "Empty",
+            "count": 0,
+            "total_weight": "0t",
+            "change": "-2",
+            "weight_constraint": "Cleared for reorganization"
+        },
+        {
+            "dock": "d2",
+            "pile": "p2", 
+            "containers": "c3(4t)",
+            "count": 1,
+            "total_weight": "4t",
+            "change": "-2",
+            "weight_constraint": "Keep c3, move others"
+        },
+        {
+            "dock": "d3",
+            "pile": "p3",
+            "containers": "c4(4t) → c5(4t) → c1(2t) → c2(4t)",
+            "count": 4,
+            "total_weight": "14t",
+            "change": "+4",
+            "weight_constraint": "Target: c4→c5→c1→c2 stack"
+        }
+    ]
+}
+
+
+def _display_distributions(domain_objects):
+    """Show the domain, the weight-specific distributions and their summary."""
+    LogisticsDisplay.display_domain_info(domain_objects)
+    LogisticsDisplay.display_weight_challenge_distribution(_INITIAL_DISTRIBUTION, _TARGET_DISTRIBUTION)
+    LogisticsDisplay.display_distribution_summary(_INITIAL_DISTRIBUTION, _TARGET_DISTRIBUTION)
 
-    problem, domain, domain_objects = build_problem_refactored()
 
-    # Display domain information
-    LogisticsDisplay.display_domain_info(domain_objects)
+def solve_refactored(verbose: bool = True, plain: bool = False):
+    """Solve the tricky weight challenge; plain prints the plan as text when not verbose."""
+    if verbose:
+        console.print(Panel("⚖️ Tricky Weight Challenge (Refactored)\nDomain is independent; demo builds world and state locally", title="Refactored Tricky Weight", title_align="left", border_style="blue"))
 
-    # Display weight challenge specific distribution
-    initial_distribution = {
-        "dock_distributions": [
-            {
-                "dock": "d1",
-                "pile": "p1", 
-                "containers": "c1(2t) → c2(4t)",
-                "count": 2,
-                "total_weight": "6t",
-                "robot": "r1"
-            },
-            {
-                "dock": "d2",
-                "pile": "p2",
-                "containers": "c3(4t) → c4(4t) → c5(4t)",
-                "count": 3,
-                "total_weight": "12t",
-                "robot": "-"
-            },
-            {
-                "dock": "d3", 
-                "pile": "p3",
-                "containers": "Empty",
-                "count": 0,
-                "total_weight": "0t",
-                "robot": "-"
-            }
-        ],
-        "robot_capacities": [
-            {
-                "robot": "r1",
-                "capacity": "6t",
-                "slots": "2",
-                "current_load": "0t",
-                "available": "6t (2 slots)"
-            }
-        ],
-        "summary_metrics": [
-            {
-                "name": "Total Containers",
-                "initial": 5,
-                "target": 5,
-                "change": "0"
-            },
-            {
-                "name": "Total Weight",
-                "initial": "18t",
-                "target": "18t", 
-                "change": "0"
-            },
-            {
-                "name": "Robot Capacity",
-                "initial": "6t (2 slots)",
-                "target": "6t (2 slots)", 
-                "change": "No change"
-            }
-        ]
-    }
+    problem, domain, domain_objects = build_problem_refactored()
 
-    target_distribution = {
-        "dock_distributions": [
-            {
-                "dock": "d1",
-                "pile": "p1",
-                "containers": "Empty",
-                "count": 0,
-                "total_weight": "0t",
-                "change": "-2",
-                "weight_constraint": "Cleared for reorganization"
-            },
-            {
-                "dock": "d2",
-                "pile": "p2", 
-                "containers": "c3(4t)",
-                "count": 1,
-                "total_weight": "4t",
-                "change": "-2",
-                "weight_constraint": "Keep c3, move others"
-            },
-            {
-                "dock": "d3",
-                "pile": "p3",
-                "containers": "c4(4t) → c5(4t) → c1(2t) → c2(4t)",
-                "count": 4,
-                "total_weight": "14t",
-                "change": "+4",
-                "weight_constraint": "Target: c4→c5→c1→c2 stack"
-            }
-        ]
-    }
-    
-    # Use the weight-specific display
-    LogisticsDisplay.display_weight_challenge_distribution(initial_distribution, target_distribution)
-    
-    # Display distribution summary
-    LogisticsDisplay.display_distribution_summary(initial_distribution, target_distribution)
+    if verbose:
+        print_scenario(lambda: _display_distributions(domain_objects))
 
-    console.print(f"\n[bold blue]🤖 Solving refactored tricky weight challenge...[/bold blue]")
+        console.print(f"\n[bold blue]🤖 Solving refactored tricky weight challenge...[/bold blue]")
 
-    with OneshotPlanner(name='fast-downward') as planner:
-        start = time.time()
-        result = planner.solve(problem)
-        elapsed = time.time() - start
+    start = time.perf_counter_ns()
+    result = solve_with_fast_downward(problem)
+    elapsed = (time.perf_counter_ns() - start) / 1e9
 
     if result.status == PlanGenerationResultStatus.SOLVED_SATISFICING:
         console.print(f"[bold green]✅ SUCCESS! Completed in {elapsed:.3f}s[/bold green]")
 
-        if result.plan:
+        if result.plan and verbose:
             # Use the detailed plan execution display with weight information
-            LogisticsDisplay.display_plan_execution_detailed(result, "Tricky Weight Challenge Plan")
+            LogisticsDisplay.display_plan_execution_detailed(result, "Tricky Weight Challenge Plan", problem)
             
             # Display plan summary
             LogisticsDisplay.display_plan_summary(result, elapsed, "Planning Results")
 
-            if len(result.plan.actions) == 19:
-                console.print("[bold green]🎯 Plan length matches expected 19 steps[/bold green]")
+            if len(result.plan.actions) == OPTIMAL_PLAN_LENGTH:
+                console.print(f"[bold green]🎯 Plan length matches the {OPTIMAL_PLAN_LENGTH}-step optimum[/bold green]")
             else:
-                console.print(f"[bold yellow]ℹ️ Plan length = {len(result.plan.actions)} (expected 19). This can vary with planner heuristics but should generally match if model is identical.[/bold yellow]")
+                console.print(f"[bold yellow]ℹ️ Plan length = {len(result.plan.actions)} (shortest is {OPTIMAL_PLAN_LENGTH}). The default greedy search does not guarantee shortest plans.[/bold yellow]")
+        elif result.plan and plain:
+            LogisticsDisplay.display_plan_plain(result, "Tricky Weight Challenge Plan")
 
         return True, len(result.plan.actions) if result.plan else 0
 
@@ -316,7 +236,11 @@ def solve_refactored():
 
 
 def main():
-    solve_refactored()
+    global console
+    args = parse_demo_args("Tricky weight challenge demo")
+    if args.quiet:
+        console = set_quiet()
+    solve_refactored(verbose=not (args.quiet or args.plain), plain=args.plain)
 
 
 if __name__ == "__main__":
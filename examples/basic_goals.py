@@ -3,7 +3,6 @@ Basic goal examples for the logistics domain.
 Demonstrates simple planning goals and their solutions.
 """
 
-from unified_planning.shortcuts import *
 import sys
 import os
 
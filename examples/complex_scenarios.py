@@ -3,7 +3,6 @@ Complex planning scenarios for the logistics domain.
 Demonstrates more challenging planning problems with multiple constraints.
 """
 
-from unified_planning.shortcuts import *
 import sys
 import os
 
@@ -3,18 +3,48 @@
 Working multi-step planning demo - simplified approach without capacity constraints.
 """
 
-from unified_planning.shortcuts import *
-from rich.console import Console
+import argparse
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from unified_planning.io import PDDLWriter
+from unified_planning.shortcuts import (
+    BoolType, InstantaneousAction, Object, Problem, UserType
+)
 from rich.panel import Panel
 from rich.table import Table
 import time
 
-console = Console()
+from src.domain import CachedFluent
+from utils.display import QuietConsole, make_console
+from utils.fast_downward import solve_pddl_with_fast_downward
 
-def create_working_multi_robot_problem():
-    """Create a simple logistics problem that definitely works."""
-    
-    problem = Problem("working_multi_robot")
+console = make_console()
+
+# Dock networks as (index, index) edges into the (d1, ..., d5) tuple; constant
+# tuples are built once at compile time instead of on every scenario call
+LINEAR_PATH = ((0, 1), (1, 2), (2, 3), (3, 4))
+# d1-d3, d2-d3, d3-d4, d3-d5, d4-d5 (star around d3) plus a direct d1-d2 path
+STAR_NETWORK = ((0, 2), (1, 2), (2, 3), (2, 4), (3, 4), (0, 1))
+
+
+@lru_cache(maxsize=None)
+def dock_adjacency(adjacent, docks, edges):
+    """Return initial values marking each (index, index) dock edge adjacent in both directions.
+
+    The skeleton's fluent and docks are shared by every scenario, so the three
+    linear-path scenarios get the same cached mapping; callers only read it.
+    """
+    # The expression manager interns the True constant, so promoting it per
+    # entry returns the same FNode and needs no precomputed value here
+    return dict.fromkeys((adjacent(docks[a], docks[b]) for i, j in edges for a, b in ((i, j), (j, i))), True)
+
+@lru_cache(maxsize=1)
+def _multi_robot_skeleton():
+    """Build the types, objects, fluents and move action shared by every scenario, once per process."""
     
     # Define types
     Robot = UserType("Robot")
@@ -29,14 +59,10 @@ def create_working_multi_robot_problem():
     d4 = Object("d4", Dock)
     d5 = Object("d5", Dock)
     
-    problem.add_objects([r1, r2, d1, d2, d3, d4, d5])
-    
-    # Simple boolean fluents - no capacity constraints for now
-    robot_at = Fluent("robot_at", BoolType(), robot=Robot, dock=Dock)
-    adjacent = Fluent("adjacent", BoolType(), dock1=Dock, dock2=Dock)
-    
-    problem.add_fluent(robot_at, default_initial_value=False)
-    problem.add_fluent(adjacent, default_initial_value=False)
+    # Simple boolean fluents - no capacity constraints for now. Scenarios ground
+    # the same robot_at/adjacent pairs repeatedly, so applications are memoized
+    robot_at = CachedFluent("robot_at", BoolType(), robot=Robot, dock=Dock)
+    adjacent = CachedFluent("adjacent", BoolType(), dock1=Dock, dock2=Dock)
     
     # Simple move action - multiple robots can be at same dock
     move = InstantaneousAction("move", robot=Robot, from_dock=Dock, to_dock=Dock)
@@ -52,9 +78,22 @@ def create_working_multi_robot_problem():
     move.add_effect(robot_at(robot, from_dock), False)
     move.add_effect(robot_at(robot, to_dock), True)
     
+    return (r1, r2), (d1, d2, d3, d4, d5), (robot_at, adjacent), move
+
+def create_working_multi_robot_problem():
+    """Create a simple logistics problem that definitely works."""
+    
+    # Objects, fluents and the action are shared; only the Problem shell is new,
+    # so each scenario's initial state and goals stay separate
+    robots, docks, fluents, move = _multi_robot_skeleton()
+    
+    problem = Problem("working_multi_robot")
+    problem.add_objects([*robots, *docks])
+    for fluent in fluents:
+        problem.add_fluent(fluent, default_initial_value=False)
     problem.add_action(move)
     
-    return problem, (r1, r2), (d1, d2, d3, d4, d5), (robot_at, adjacent)
+    return problem, robots, docks, fluents
 
 def scenario_1_long_path():
     """Robot r1 must travel a long path d1 → d2 → d3 → d4 → d5."""
@@ -65,21 +104,16 @@ def scenario_1_long_path():
         border_style="blue"
     ))
     
-    problem, (r1, r2), (d1, d2, d3, d4, d5), (robot_at, adjacent) = create_working_multi_robot_problem()
+    problem, (r1, r2), docks, (robot_at, adjacent) = create_working_multi_robot_problem()
+    d1, d2, d3, d4, d5 = docks
     
     # Set initial state: r1 at d1, r2 at d3 (out of direct path)
     problem.set_initial_value(robot_at(r1, d1), True)
     problem.set_initial_value(robot_at(r2, d3), True)
     
     # Create linear path: d1-d2-d3-d4-d5
-    problem.set_initial_value(adjacent(d1, d2), True)
-    problem.set_initial_value(adjacent(d2, d1), True)
-    problem.set_initial_value(adjacent(d2, d3), True)
-    problem.set_initial_value(adjacent(d3, d2), True)
-    problem.set_initial_value(adjacent(d3, d4), True)
-    problem.set_initial_value(adjacent(d4, d3), True)
-    problem.set_initial_value(adjacent(d4, d5), True)
-    problem.set_initial_value(adjacent(d5, d4), True)
+    for fluent, value in dock_adjacency(adjacent, docks, LINEAR_PATH).items():
+        problem.set_initial_value(fluent, value)
     
     # Goal: r1 must reach d5
     problem.add_goal(robot_at(r1, d5))
@@ -95,24 +129,20 @@ def scenario_2_robot_coordination():
         border_style="green"
     ))
     
-    problem, (r1, r2), (d1, d2, d3, d4, d5), (robot_at, adjacent) = create_working_multi_robot_problem()
+    problem, (r1, r2), docks, (robot_at, adjacent) = create_working_multi_robot_problem()
+    d1, d2, d3, d4, d5 = docks
     
     # Set initial state: r1 at d1, r2 at d5 (opposite ends)
     problem.set_initial_value(robot_at(r1, d1), True)
     problem.set_initial_value(robot_at(r2, d5), True)
     
     # Create linear path: d1-d2-d3-d4-d5
-    problem.set_initial_value(adjacent(d1, d2), True)
-    problem.set_initial_value(adjacent(d2, d1), True)
-    problem.set_initial_value(adjacent(d2, d3), True)
-    problem.set_initial_value(adjacent(d3, d2), True)
-    problem.set_initial_value(adjacent(d3, d4), True)
-    problem.set_initial_value(adjacent(d4, d3), True)
-    problem.set_initial_value(adjacent(d4, d5), True)
-    problem.set_initial_value(adjacent(d5, d4), True)
+    for fluent, value in dock_adjacency(adjacent, docks, LINEAR_PATH).items():
+        problem.set_initial_value(fluent, value)
     
     # Goal: Robots swap to opposite ends
-    problem.add_goal(And(robot_at(r1, d5), robot_at(r2, d1)))
+    problem.add_goal(robot_at(r1, d5))
+    problem.add_goal(robot_at(r2, d1))
     
     return problem, "r1 and r2 travel to opposite ends"
 
@@ -125,24 +155,20 @@ def scenario_3_convergence():
         border_style="red"
     ))
     
-    problem, (r1, r2), (d1, d2, d3, d4, d5), (robot_at, adjacent) = create_working_multi_robot_problem()
+    problem, (r1, r2), docks, (robot_at, adjacent) = create_working_multi_robot_problem()
+    d1, d2, d3, d4, d5 = docks
     
     # Set initial state: r1 at d1, r2 at d5 (opposite ends)
     problem.set_initial_value(robot_at(r1, d1), True)
     problem.set_initial_value(robot_at(r2, d5), True)
     
     # Create linear path: d1-d2-d3-d4-d5
-    problem.set_initial_value(adjacent(d1, d2), True)
-    problem.set_initial_value(adjacent(d2, d1), True)
-    problem.set_initial_value(adjacent(d2, d3), True)
-    problem.set_initial_value(adjacent(d3, d2), True)
-    problem.set_initial_value(adjacent(d3, d4), True)
-    problem.set_initial_value(adjacent(d4, d3), True)
-    problem.set_initial_value(adjacent(d4, d5), True)
-    problem.set_initial_value(adjacent(d5, d4), True)
+    for fluent, value in dock_adjacency(adjacent, docks, LINEAR_PATH).items():
+        problem.set_initial_value(fluent, value)
     
     # Goal: Both robots at d3 (middle)
-    problem.add_goal(And(robot_at(r1, d3), robot_at(r2, d3)))
+    problem.add_goal(robot_at(r1, d3))
+    problem.add_goal(robot_at(r2, d3))
     
     return problem, "Both robots converge at d3"
 
@@ -155,91 +181,95 @@ def scenario_4_complex_network():
         border_style="magenta"
     ))
     
-    problem, (r1, r2), (d1, d2, d3, d4, d5), (robot_at, adjacent) = create_working_multi_robot_problem()
+    problem, (r1, r2), docks, (robot_at, adjacent) = create_working_multi_robot_problem()
+    d1, d2, d3, d4, d5 = docks
     
     # Set initial state: r1 at d1, r2 at d2
     problem.set_initial_value(robot_at(r1, d1), True)
     problem.set_initial_value(robot_at(r2, d2), True)
     
-    # Create complex network (star pattern with d3 as center)
-    # d1-d3, d2-d3, d3-d4, d3-d5, d4-d5 (multiple paths)
-    problem.set_initial_value(adjacent(d1, d3), True)
-    problem.set_initial_value(adjacent(d3, d1), True)
-    problem.set_initial_value(adjacent(d2, d3), True)
-    problem.set_initial_value(adjacent(d3, d2), True)
-    problem.set_initial_value(adjacent(d3, d4), True)
-    problem.set_initial_value(adjacent(d4, d3), True)
-    problem.set_initial_value(adjacent(d3, d5), True)
-    problem.set_initial_value(adjacent(d5, d3), True)
-    problem.set_initial_value(adjacent(d4, d5), True)
-    problem.set_initial_value(adjacent(d5, d4), True)
-    # Add direct path d1-d2 for more options
-    problem.set_initial_value(adjacent(d1, d2), True)
-    problem.set_initial_value(adjacent(d2, d1), True)
+    # Create complex network (star pattern with d3 as center, multiple paths)
+    for fluent, value in dock_adjacency(adjacent, docks, STAR_NETWORK).items():
+        problem.set_initial_value(fluent, value)
     
     # Goal: r1 to d4, r2 to d5
-    problem.add_goal(And(robot_at(r1, d4), robot_at(r2, d5)))
+    problem.add_goal(robot_at(r1, d4))
+    problem.add_goal(robot_at(r2, d5))
     
     return problem, "r1 reaches d4, r2 reaches d5 via optimal paths"
 
-def solve_and_display(problem, description, scenario_name):
-    """Solve a problem and display the results."""
-    
-    console.print(f"\n[bold yellow]🎯 Goal:[/bold yellow] {description}")
-    console.print(f"[bold blue]🤖 Solving with fast-downward...[/bold blue]")
-    
-    try:
-        with OneshotPlanner(name='fast-downward') as planner:
-            start_time = time.time()
-            result = planner.solve(problem)
-            solve_time = time.time() - start_time
-            
-            if result.status.name == 'SOLVED_SATISFICING':
-                console.print(f"[green]✅ SUCCESS! Plan found in {solve_time:.3f}s[/green]")
-                
-                # Display plan
-                plan_table = Table(title=f"📋 {scenario_name} - Execution Plan", show_header=True, header_style="bold green")
-                plan_table.add_column("Step", style="cyan", justify="center")
-                plan_table.add_column("Action", style="white")
-                plan_table.add_column("Robot", style="yellow")
-                plan_table.add_column("Movement", style="green")
-                plan_table.add_column("Description", style="blue")
-                
-                for i, action in enumerate(result.plan.actions, 1):
-                    action_name = action.action.name
-                    params = [str(p) for p in action.actual_parameters]
-                    robot_param, from_param, to_param = params
-                    
-                    movement = f"{from_param} → {to_param}"
-                    description = f"Robot {robot_param} moves from dock {from_param} to dock {to_param}"
-                    
-                    plan_table.add_row(str(i), action_name, robot_param, movement, description)
-                
-                console.print(plan_table)
-                
-                # Summary
-                summary_table = Table(title="📊 Planning Summary", show_header=True, header_style="bold cyan")
-                summary_table.add_column("Metric", style="cyan")
-                summary_table.add_column("Value", style="white")
-                
-                summary_table.add_row("Plan Length", f"{len(result.plan.actions)} steps")
-                summary_table.add_row("Solve Time", f"{solve_time:.3f} seconds")
-                summary_table.add_row("Status", str(result.status))
-                summary_table.add_row("Scenario", scenario_name)
-                
-                console.print(summary_table)
-                
-                return True, len(result.plan.actions)
-            else:
-                console.print(f"[red]❌ Planning failed: {result.status}[/red]")
-                return False, 0
-                
-    except Exception as e:
-        console.print(f"[red]❌ Error during planning: {e}[/red]")
+def solve_pddl(domain_pddl, problem_pddl):
+    """Solve a PDDL-encoded problem in a worker process; returns (status name, plan steps, solve time)."""
+    # The PDDL goes to Fast Downward as is; translator output is cached across reruns.
+    # Fast Downward reads one task per process, so there is no planner to keep
+    # open between scenarios; a cached task starts only the search binary
+    start_time = time.perf_counter_ns()
+    status, steps = solve_pddl_with_fast_downward("working_multi_robot", domain_pddl, problem_pddl)
+    solve_time = (time.perf_counter_ns() - start_time) / 1e9
+    
+    return status.name, steps or [], solve_time
+
+def display_result(outcome, description, scenario_name, verbose=True):
+    """Display the outcome of solve_pddl for one scenario; tables are only built when verbose.
+
+    Called as each result arrives, so one scenario's tables are laid out while
+    later scenarios are still solving in the pool. Solve times are measured in
+    the workers and never include rendering.
+    """
+    status, steps, solve_time = outcome
+    
+    console.print(f"\n[bold yellow]🎯 Goal ({scenario_name}):[/bold yellow] {description}")
+    
+    if status == 'SOLVED_SATISFICING':
+        console.print(f"[green]✅ SUCCESS! Plan found in {solve_time:.3f}s[/green]")
+        if not verbose:
+            return True, len(steps)
+        
+        # Display plan
+        plan_table = Table(title=f"📋 {scenario_name} - Execution Plan", show_header=True, header_style="bold green")
+        plan_table.add_column("Step", style="cyan", justify="center")
+        plan_table.add_column("Action", style="white")
+        plan_table.add_column("Robot", style="yellow")
+        plan_table.add_column("Movement", style="green")
+        plan_table.add_column("Description", style="blue")
+        
+        rows = [
+            (str(i), action_name, robot_param, f"{from_param} → {to_param}",
+             f"Robot {robot_param} moves from dock {from_param} to dock {to_param}")
+            for i, (action_name, robot_param, from_param, to_param) in enumerate(steps, 1)
+        ]
+        for row in rows:
+            plan_table.add_row(*row)
+        
+        console.print(plan_table)
+        
+        # Summary
+        summary_table = Table(title="📊 Planning Summary", show_header=True, header_style="bold cyan")
+        summary_table.add_column("Metric", style="cyan")
+        summary_table.add_column("Value", style="white")
+        
+        summary_table.add_row("Plan Length", f"{len(steps)} steps")
+        summary_table.add_row("Solve Time", f"{solve_time:.3f} seconds")
+        summary_table.add_row("Status", f"PlanGenerationResultStatus.{status}")
+        summary_table.add_row("Scenario", scenario_name)
+        
+        console.print(summary_table)
+        
+        return True, len(steps)
+    else:
+        console.print(f"[red]❌ Planning failed: PlanGenerationResultStatus.{status}[/red]")
         return False, 0
 
 def main():
     """Run working multi-step planning scenarios."""
+    global console
+    parser = argparse.ArgumentParser(description="Multi-robot coordination demo")
+    parser.add_argument("--quiet", action="store_true", help="Suppress console output (also enabled by LOGISTICS_QUIET)")
+    args = parser.parse_args()
+    if args.quiet:
+        console = make_console(quiet=True)
+    # Plan and summary tables are skipped entirely when nothing is printed
+    verbose = not isinstance(console, QuietConsole)
     
     console.print(Panel.fit(
         "[bold blue]🤖 Working Multi-Step Planning Demo[/bold blue]\n"
@@ -256,14 +286,30 @@ def main():
     
     results = []
     
-    for scenario_name, scenario_func in scenarios:
-        console.print(f"\n{'='*60}")
-        problem, description = scenario_func()
-        success, steps = solve_and_display(problem, description, scenario_name)
-        results.append((scenario_name, success, steps))
+    # Fast Downward is single-threaded, so the scenarios are solved in parallel
+    # worker processes. Problems travel as PDDL text and results are shown in order;
+    # waiting in submission order rather than as_completed costs no wall time,
+    # since the run ends with the slowest solve either way.
+    with ProcessPoolExecutor(max_workers=min(len(scenarios), os.cpu_count() or 1)) as pool:
+        pending = []
+        for scenario_name, scenario_func in scenarios:
+            console.print(f"\n{'='*60}")
+            problem, description = scenario_func()
+            writer = PDDLWriter(problem)
+            future = pool.submit(solve_pddl, writer.get_domain(), writer.get_problem())
+            pending.append((scenario_name, description, future))
         
-        time.sleep(0.5)
+        console.print(f"\n[bold blue]🤖 Solving {len(pending)} scenarios with fast-downward...[/bold blue]")
+        for scenario_name, description, future in pending:
+            console.print(f"\n{'='*60}")
+            success, steps = display_result(future.result(), description, scenario_name, verbose)
+            results.append((scenario_name, success, steps))
     
+    successful_scenarios = sum(1 for _, success, _ in results if success)
+    total_scenarios = len(results)
+    if not verbose:
+        return successful_scenarios == total_scenarios
+
     # Final summary
     console.print(f"\n{'='*60}")
     console.print(Panel.fit(
@@ -292,8 +338,6 @@ def main():
     
     console.print(results_table)
     
-    successful_scenarios = sum(1 for _, success, _ in results if success)
-    total_scenarios = len(results)
     total_steps = sum(steps for _, success, steps in results if success)
     
     if successful_scenarios == total_scenarios:
@@ -310,3 +354,4 @@ if __name__ == "__main__":
         console.print("\n[bold yellow]🚀 Multi-robot coordination demo completed![/bold yellow]")
     else:
         console.print("\n[bold red]❌ Some scenarios failed - debugging needed[/bold red]")
+    sys.exit(0 if success else 1)
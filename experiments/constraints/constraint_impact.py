@@ -16,6 +16,7 @@ import statistics
 import json
 import matplotlib.pyplot as plt
 import pandas as pd
+from itertools import chain
 from typing import Dict, List, Tuple
 from pathlib import Path
 
@@ -25,7 +26,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.domain import LogisticsDomain
 from src.actions import LogisticsActions
 from unified_planning.model import Problem, Object
-from unified_planning.shortcuts import And, OneshotPlanner
+from unified_planning.shortcuts import OneshotPlanner
 from unified_planning.engines.results import PlanGenerationResultStatus
 
 class ConstraintImpactExperiment:
@@ -79,6 +80,9 @@ class ConstraintImpactExperiment:
     def create_problem(self, config: Dict) -> Tuple[Problem, LogisticsDomain]:
         """Create a logistics problem with given constraint configuration."""
         domain = LogisticsDomain(scale="small", auto_objects=False)
+        in_pile = domain.container_in_pile
+        on_top = domain.container_on_top_of_pile
+        under = domain.container_under_in_pile
         problem = Problem(f"constraint_impact_{config['name']}")
         
         # Create objects
@@ -99,7 +103,7 @@ class ConstraintImpactExperiment:
         })
         
         # Add fluents
-        for fluent in domain.fluents + domain.static_fluents:
+        for fluent in chain(domain.fluents, domain.static_fluents):
             problem.add_fluent(fluent, default_initial_value=False)
         
         # Add actions
@@ -114,11 +118,8 @@ class ConstraintImpactExperiment:
         for i, robot in enumerate(robots):
             dock = docks[i % len(docks)]
             initial_state[domain.robot_at(robot, dock)] = True
-            initial_state[domain.robot_can_carry_1(robot)] = True
-            initial_state[domain.robot_can_carry_2(robot)] = True
-            initial_state[domain.robot_can_carry_3(robot)] = False
+            initial_state.update(domain.slot_capacity(robot, 2))
             initial_state[domain.robot_weight_0(robot)] = True
-            initial_state[domain.robot_free(robot)] = True
             
             # Set capacity based on constraint type
             if config.get("tight_capacity", False):
@@ -151,19 +152,17 @@ class ConstraintImpactExperiment:
             
             pile_containers = containers[start_idx:end_idx]
             for j, container in enumerate(pile_containers):
-                initial_state[domain.container_in_pile(container, pile)] = True
+                initial_state[in_pile(container, pile)] = True
                 if j == len(pile_containers) - 1:
-                    initial_state[domain.container_on_top_of_pile(container, pile)] = True
+                    initial_state[on_top(container, pile)] = True
                 if j > 0:
-                    initial_state[domain.container_under_in_pile(pile_containers[j-1], container, pile)] = True
+                    initial_state[under(pile_containers[j-1], container, pile)] = True
             
             dock = docks[i % len(docks)]
             initial_state[domain.pile_at_dock(pile, dock)] = True
         
         # Adjacency
-        for i in range(len(docks) - 1):
-            initial_state[domain.adjacent(docks[i], docks[i+1])] = True
-            initial_state[domain.adjacent(docks[i+1], docks[i])] = True
+        initial_state.update(domain.connections(zip(docks, docks[1:])))
         
         # Set initial values
         for fluent, value in initial_state.items():
@@ -174,16 +173,16 @@ class ConstraintImpactExperiment:
         if len(containers) >= 4 and len(piles) >= 3:
             goal_conditions.extend([
                 # Move containers to create a specific pattern
-                domain.container_in_pile(containers[0], piles[1]),
-                domain.container_on_top_of_pile(containers[0], piles[1]),
-                domain.container_in_pile(containers[1], piles[2]),
-                domain.container_on_top_of_pile(containers[1], piles[2]),
-                domain.container_in_pile(containers[2], piles[0]),
-                domain.container_on_top_of_pile(containers[2], piles[0])
+                in_pile(containers[0], piles[1]),
+                on_top(containers[0], piles[1]),
+                in_pile(containers[1], piles[2]),
+                on_top(containers[1], piles[2]),
+                in_pile(containers[2], piles[0]),
+                on_top(containers[2], piles[0])
             ])
         
-        if goal_conditions:
-            problem.add_goal(And(*goal_conditions))
+        for goal in goal_conditions:
+            problem.add_goal(goal)
         
         return problem, domain
     
@@ -200,10 +199,10 @@ class ConstraintImpactExperiment:
             try:
                 problem, domain = self.create_problem(config)
                 
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 with OneshotPlanner(name='fast-downward') as planner:
                     result = planner.solve(problem)
-                solve_time = time.time() - start_time
+                solve_time = (time.perf_counter_ns() - start_time) / 1e9
                 
                 success = result.status == PlanGenerationResultStatus.SOLVED_SATISFICING
                 plan_length = len(result.plan.actions) if result.plan else 0
@@ -11,11 +11,12 @@ import time
 import json
 import csv
 import statistics
+from itertools import chain
 from typing import Dict, List, Tuple
 import matplotlib.pyplot as plt
 import pandas as pd
 
-from unified_planning.shortcuts import *
+from unified_planning.shortcuts import Object, OneshotPlanner, Problem
 from unified_planning.engines.results import PlanGenerationResultStatus
 from unified_planning.io import PDDLWriter
 import tempfile
@@ -28,14 +29,14 @@ class HeuristicExperiment:
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
         
-        # Fast Downward heuristic/search configurations to compare - including more diverse heuristics
+        # Fast Downward heuristic/search configurations to compare - including more diverse heuristics.
+        # LM-cut is left out: it does not support the conditional effects of pickup and putdown
         self.fd_searches = [
             {"name": "gbfs_ff", "search": "gbfs(ff())"},
             {"name": "gbfs_hadd", "search": "gbfs(hadd())"},
             {"name": "gbfs_hmax", "search": "gbfs(hmax())"},
             {"name": "gbfs_cg", "search": "gbfs(cg())"},
             {"name": "gbfs_cea", "search": "gbfs(cea())"},
-            {"name": "gbfs_lmcut", "search": "gbfs(lmcut())"},
             {"name": "gbfs_blind", "search": "gbfs(blind())"},
         ]
         
@@ -50,10 +51,28 @@ class HeuristicExperiment:
         ]
         
         self.results = []
+        # Problems by configuration; every search is run on the same instance
+        self._problems: Dict[tuple, Tuple[Problem, LogisticsDomain]] = {}
     
     def create_problem(self, config: Dict) -> Tuple[Problem, LogisticsDomain]:
+        """Return the logistics problem for a configuration, building it on first use.
+
+        Each configuration is solved with every search in fd_searches, and
+        solving never modifies the problem, so its objects, initial state and
+        goals are built once and shared by all of them. Callers that need a
+        variant (another goal, say) should modify problem.clone() instead.
+        """
+        key = tuple(sorted(config.items()))
+        if key not in self._problems:
+            self._problems[key] = self._build_problem(config)
+        return self._problems[key]
+
+    def _build_problem(self, config: Dict) -> Tuple[Problem, LogisticsDomain]:
         """Create a logistics problem with given configuration."""
         domain = LogisticsDomain(scale="small", auto_objects=False)
+        in_pile = domain.container_in_pile
+        on_top = domain.container_on_top_of_pile
+        under = domain.container_under_in_pile
         problem = Problem(f"heuristic_test_{config['name']}")
         
         # Create objects
@@ -75,7 +94,7 @@ class HeuristicExperiment:
         })
         
         # Add fluents
-        for fluent in domain.fluents + domain.static_fluents:
+        for fluent in chain(domain.fluents, domain.static_fluents):
             problem.add_fluent(fluent, default_initial_value=False)
         
         # Add actions
@@ -90,11 +109,8 @@ class HeuristicExperiment:
         for i, robot in enumerate(robots):
             dock = docks[i % len(docks)]
             initial_state[domain.robot_at(robot, dock)] = True
-            initial_state[domain.robot_can_carry_1(robot)] = True
-            initial_state[domain.robot_can_carry_2(robot)] = True
-            initial_state[domain.robot_can_carry_3(robot)] = False
+            initial_state.update(domain.slot_capacity(robot, 2))
             initial_state[domain.robot_weight_0(robot)] = True
-            initial_state[domain.robot_free(robot)] = True
             
             # Set capacity based on problem difficulty
             if config["name"].startswith("easy"):
@@ -144,19 +160,17 @@ class HeuristicExperiment:
             
             pile_containers = containers[start_idx:end_idx]
             for j, container in enumerate(pile_containers):
-                initial_state[domain.container_in_pile(container, pile)] = True
+                initial_state[in_pile(container, pile)] = True
                 if j == len(pile_containers) - 1:
-                    initial_state[domain.container_on_top_of_pile(container, pile)] = True
+                    initial_state[on_top(container, pile)] = True
                 if j > 0:
-                    initial_state[domain.container_under_in_pile(pile_containers[j-1], container, pile)] = True
+                    initial_state[under(pile_containers[j-1], container, pile)] = True
             
             dock = docks[i % len(docks)]
             initial_state[domain.pile_at_dock(pile, dock)] = True
         
         # Adjacency (linear topology)
-        for i in range(len(docks) - 1):
-            initial_state[domain.adjacent(docks[i], docks[i+1])] = True
-            initial_state[domain.adjacent(docks[i+1], docks[i])] = True
+        initial_state.update(domain.connections(zip(docks, docks[1:])))
         
         # Set initial values
         for fluent, value in initial_state.items():
@@ -171,10 +185,10 @@ class HeuristicExperiment:
             if len(containers) >= 2 and len(piles) >= 2:
                 # Move first container from p1 to p2, second from p2 to p1
                 goal_conditions.extend([
-                    domain.container_in_pile(containers[0], piles[1]),
-                    domain.container_on_top_of_pile(containers[0], piles[1]),
-                    domain.container_in_pile(containers[1], piles[0]),
-                    domain.container_on_top_of_pile(containers[1], piles[0])
+                    in_pile(containers[0], piles[1]),
+                    on_top(containers[0], piles[1]),
+                    in_pile(containers[1], piles[0]),
+                    on_top(containers[1], piles[0])
                 ])
         
         elif goal_type == "complex_redistribution":
@@ -183,16 +197,16 @@ class HeuristicExperiment:
                 # Create a specific stacking pattern across multiple piles
                 goal_conditions.extend([
                     # Pile 0: containers[0] on top
-                    domain.container_in_pile(containers[0], piles[0]),
-                    domain.container_on_top_of_pile(containers[0], piles[0]),
+                    in_pile(containers[0], piles[0]),
+                    on_top(containers[0], piles[0]),
                     # Pile 1: containers[1] on top, containers[2] underneath
-                    domain.container_in_pile(containers[1], piles[1]),
-                    domain.container_on_top_of_pile(containers[1], piles[1]),
-                    domain.container_in_pile(containers[2], piles[1]),
-                    domain.container_under_in_pile(containers[2], containers[1], piles[1]),
+                    in_pile(containers[1], piles[1]),
+                    on_top(containers[1], piles[1]),
+                    in_pile(containers[2], piles[1]),
+                    under(containers[2], containers[1], piles[1]),
                     # Pile 2: containers[3] on top
-                    domain.container_in_pile(containers[3], piles[2]),
-                    domain.container_on_top_of_pile(containers[3], piles[2])
+                    in_pile(containers[3], piles[2]),
+                    on_top(containers[3], piles[2])
                 ])
         
         elif goal_type == "weight_constrained":
@@ -202,23 +216,23 @@ class HeuristicExperiment:
                 # Create a pattern that requires weight-aware planning
                 goal_conditions.extend([
                     # Pile 0: light container on top
-                    domain.container_in_pile(containers[0], piles[0]),
-                    domain.container_on_top_of_pile(containers[0], piles[0]),
+                    in_pile(containers[0], piles[0]),
+                    on_top(containers[0], piles[0]),
                     # Pile 1: heavy container on top, medium underneath
-                    domain.container_in_pile(containers[1], piles[1]),
-                    domain.container_on_top_of_pile(containers[1], piles[1]),
-                    domain.container_in_pile(containers[2], piles[1]),
-                    domain.container_under_in_pile(containers[2], containers[1], piles[1]),
+                    in_pile(containers[1], piles[1]),
+                    on_top(containers[1], piles[1]),
+                    in_pile(containers[2], piles[1]),
+                    under(containers[2], containers[1], piles[1]),
                     # Pile 2: medium container on top
-                    domain.container_in_pile(containers[3], piles[2]),
-                    domain.container_on_top_of_pile(containers[3], piles[2]),
+                    in_pile(containers[3], piles[2]),
+                    on_top(containers[3], piles[2]),
                     # Pile 3: heavy container on top
-                    domain.container_in_pile(containers[4], piles[3]),
-                    domain.container_on_top_of_pile(containers[4], piles[3])
+                    in_pile(containers[4], piles[3]),
+                    on_top(containers[4], piles[3])
                 ])
         
-        if goal_conditions:
-            problem.add_goal(And(*goal_conditions))
+        for goal in goal_conditions:
+            problem.add_goal(goal)
         
         return problem, domain
     
@@ -231,7 +245,7 @@ class HeuristicExperiment:
         return dom_path, prob_path
 
     def _run_fast_downward(self, domain_pddl: str, problem_pddl: str, search: str, workdir: str) -> Tuple[bool, float, int, str]:
-        start = time.time()
+        start = time.perf_counter_ns()
         # Prefer 'fast-downward' if available; fallback to 'fast-downward.py'
         cmd_candidates = [
             ["fast-downward", domain_pddl, problem_pddl, "--search", search],
@@ -258,7 +272,7 @@ class HeuristicExperiment:
                                     continue
                                 plan_len += 1
                         break
-                elapsed = time.time() - start
+                elapsed = (time.perf_counter_ns() - start) / 1e9
                 return True, elapsed, plan_len, "SOLVED"
             except FileNotFoundError as e:
                 last_err = str(e)
@@ -283,10 +297,10 @@ class HeuristicExperiment:
                 problem, domain = self.create_problem(problem_config)
                 
                 # Use UP Fast Downward interface directly
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 with OneshotPlanner(name='fast-downward') as planner:
                     result = planner.solve(problem)
-                solve_time = time.time() - start_time
+                solve_time = (time.perf_counter_ns() - start_time) / 1e9
                 
                 success = result.status == PlanGenerationResultStatus.SOLVED_SATISFICING
                 plan_length = len(result.plan.actions) if result.plan else 0
@@ -11,11 +11,12 @@ import time
 import json
 import csv
 import statistics
+from itertools import chain
 from typing import Dict, List, Tuple
 import matplotlib.pyplot as plt
 import pandas as pd
 
-from unified_planning.shortcuts import *
+from unified_planning.shortcuts import Object, OneshotPlanner, Problem
 from unified_planning.engines.results import PlanGenerationResultStatus
 from src.domain import LogisticsDomain
 from src.actions import LogisticsActions
@@ -48,6 +49,9 @@ class ScalingExperiment:
     def create_problem(self, config: Dict) -> Tuple[Problem, LogisticsDomain]:
         """Create a logistics problem with given configuration."""
         domain = LogisticsDomain(scale="small", auto_objects=False)
+        in_pile = domain.container_in_pile
+        on_top = domain.container_on_top_of_pile
+        under = domain.container_under_in_pile
         problem = Problem(f"scaling_{config['name']}")
         
         # Create objects
@@ -69,7 +73,7 @@ class ScalingExperiment:
         })
         
         # Add fluents
-        for fluent in domain.fluents + domain.static_fluents:
+        for fluent in chain(domain.fluents, domain.static_fluents):
             problem.add_fluent(fluent, default_initial_value=False)
         
         # Add actions
@@ -87,11 +91,8 @@ class ScalingExperiment:
         
         # Robot capacities based on problem size
         for robot in robots:
-            initial_state[domain.robot_can_carry_1(robot)] = True
-            initial_state[domain.robot_can_carry_2(robot)] = True
-            initial_state[domain.robot_can_carry_3(robot)] = False
+            initial_state.update(domain.slot_capacity(robot, 2))
             initial_state[domain.robot_weight_0(robot)] = True
-            initial_state[domain.robot_free(robot)] = True
             
             # Set capacity based on problem size
             if config["name"].startswith("small"):
@@ -138,20 +139,18 @@ class ScalingExperiment:
             
             pile_containers = containers[start_idx:end_idx]
             for j, container in enumerate(pile_containers):
-                initial_state[domain.container_in_pile(container, pile)] = True
+                initial_state[in_pile(container, pile)] = True
                 if j == len(pile_containers) - 1:  # Top container
-                    initial_state[domain.container_on_top_of_pile(container, pile)] = True
+                    initial_state[on_top(container, pile)] = True
                 if j > 0:  # Under relationship
-                    initial_state[domain.container_under_in_pile(pile_containers[j-1], container, pile)] = True
+                    initial_state[under(pile_containers[j-1], container, pile)] = True
             
             # Pile at dock
             dock = docks[i % len(docks)]
             initial_state[domain.pile_at_dock(pile, dock)] = True
         
         # Adjacency (linear topology)
-        for i in range(len(docks) - 1):
-            initial_state[domain.adjacent(docks[i], docks[i+1])] = True
-            initial_state[domain.adjacent(docks[i+1], docks[i])] = True
+        initial_state.update(domain.connections(zip(docks, docks[1:])))
         
         # Set initial values
         for fluent, value in initial_state.items():
@@ -165,44 +164,44 @@ class ScalingExperiment:
             # Simple container swap between first two piles
             if len(containers) >= 2 and len(piles) >= 2:
                 goal_conditions.extend([
-                    domain.container_in_pile(containers[0], piles[1]),
-                    domain.container_on_top_of_pile(containers[0], piles[1]),
-                    domain.container_in_pile(containers[1], piles[0]),
-                    domain.container_on_top_of_pile(containers[1], piles[0])
+                    in_pile(containers[0], piles[1]),
+                    on_top(containers[0], piles[1]),
+                    in_pile(containers[1], piles[0]),
+                    on_top(containers[1], piles[0])
                 ])
         
         elif goal_type == "complex_redistribution":
             # Complex redistribution requiring multiple moves
             if len(containers) >= 4 and len(piles) >= 3:
                 goal_conditions.extend([
-                    domain.container_in_pile(containers[0], piles[0]),
-                    domain.container_on_top_of_pile(containers[0], piles[0]),
-                    domain.container_in_pile(containers[1], piles[1]),
-                    domain.container_on_top_of_pile(containers[1], piles[1]),
-                    domain.container_in_pile(containers[2], piles[1]),
-                    domain.container_under_in_pile(containers[2], containers[1], piles[1]),
-                    domain.container_in_pile(containers[3], piles[2]),
-                    domain.container_on_top_of_pile(containers[3], piles[2])
+                    in_pile(containers[0], piles[0]),
+                    on_top(containers[0], piles[0]),
+                    in_pile(containers[1], piles[1]),
+                    on_top(containers[1], piles[1]),
+                    in_pile(containers[2], piles[1]),
+                    under(containers[2], containers[1], piles[1]),
+                    in_pile(containers[3], piles[2]),
+                    on_top(containers[3], piles[2])
                 ])
         
         elif goal_type == "weight_constrained":
             # Weight-constrained redistribution requiring careful planning
             if len(containers) >= 6 and len(piles) >= 4:
                 goal_conditions.extend([
-                    domain.container_in_pile(containers[0], piles[0]),
-                    domain.container_on_top_of_pile(containers[0], piles[0]),
-                    domain.container_in_pile(containers[1], piles[1]),
-                    domain.container_on_top_of_pile(containers[1], piles[1]),
-                    domain.container_in_pile(containers[2], piles[1]),
-                    domain.container_under_in_pile(containers[2], containers[1], piles[1]),
-                    domain.container_in_pile(containers[3], piles[2]),
-                    domain.container_on_top_of_pile(containers[3], piles[2]),
-                    domain.container_in_pile(containers[4], piles[3]),
-                    domain.container_on_top_of_pile(containers[4], piles[3])
+                    in_pile(containers[0], piles[0]),
+                    on_top(containers[0], piles[0]),
+                    in_pile(containers[1], piles[1]),
+                    on_top(containers[1], piles[1]),
+                    in_pile(containers[2], piles[1]),
+                    under(containers[2], containers[1], piles[1]),
+                    in_pile(containers[3], piles[2]),
+                    on_top(containers[3], piles[2]),
+                    in_pile(containers[4], piles[3]),
+                    on_top(containers[4], piles[3])
                 ])
         
-        if goal_conditions:
-            problem.add_goal(And(*goal_conditions))
+        for goal in goal_conditions:
+            problem.add_goal(goal)
         
         return problem, domain
     
@@ -220,10 +219,10 @@ class ScalingExperiment:
             try:
                 problem, domain = self.create_problem(config)
                 
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 with OneshotPlanner(name='fast-downward') as planner:
                     result = planner.solve(problem)
-                solve_time = time.time() - start_time
+                solve_time = (time.perf_counter_ns() - start_time) / 1e9
                 
                 run_result = {
                     "run": run,
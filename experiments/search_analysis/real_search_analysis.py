@@ -204,10 +204,10 @@ class RealSearchAnalysis(HeuristicExperiment):
                 problem, domain = self.create_problem(problem_config)
                 
                 # Use UP Fast Downward interface
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 with OneshotPlanner(name='fast-downward') as planner:
                     result = planner.solve(problem)
-                solve_time = time.time() - start_time
+                solve_time = (time.perf_counter_ns() - start_time) / 1e9
                 
                 success = result.status == PlanGenerationResultStatus.SOLVED_SATISFICING
                 plan_length = len(result.plan.actions) if result.plan else 0
@@ -16,6 +16,7 @@ import statistics
 import json
 import matplotlib.pyplot as plt
 import pandas as pd
+from itertools import chain
 from typing import Dict, List, Tuple
 from pathlib import Path
 
@@ -25,7 +26,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.domain import LogisticsDomain
 from src.actions import LogisticsActions
 from unified_planning.model import Problem, Object
-from unified_planning.shortcuts import And, OneshotPlanner
+from unified_planning.shortcuts import OneshotPlanner
 from unified_planning.engines.results import PlanGenerationResultStatus
 
 class TopologyAnalysisExperiment:
@@ -98,7 +99,7 @@ class TopologyAnalysisExperiment:
         self.results = []
     
     def create_adjacency(self, config: Dict) -> List[Tuple[int, int]]:
-        """Create adjacency relationships based on topology."""
+        """Create the undirected dock connections (index pairs) for a topology."""
         docks = config["docks"]
         topology = config["topology"]
         adjacencies = []
@@ -107,14 +108,12 @@ class TopologyAnalysisExperiment:
             # Linear: d1-d2-d3-d4...
             for i in range(docks - 1):
                 adjacencies.append((i, i + 1))
-                adjacencies.append((i + 1, i))  # Bidirectional
         
         elif topology == "star":
             # Star: center (0) connected to all others
             center = 0
             for i in range(1, docks):
                 adjacencies.append((center, i))
-                adjacencies.append((i, center))  # Bidirectional
         
         elif topology == "grid":
             # Grid: 2D grid with 4-connected neighbors
@@ -126,25 +125,25 @@ class TopologyAnalysisExperiment:
                     if c < cols - 1:
                         right = r * cols + (c + 1)
                         adjacencies.append((node, right))
-                        adjacencies.append((right, node))
                     # Down neighbor
                     if r < rows - 1:
                         down = (r + 1) * cols + c
                         adjacencies.append((node, down))
-                        adjacencies.append((down, node))
         
         elif topology == "ring":
             # Ring: circular arrangement
             for i in range(docks):
                 next_i = (i + 1) % docks
                 adjacencies.append((i, next_i))
-                adjacencies.append((next_i, i))  # Bidirectional
         
         return adjacencies
     
     def create_problem(self, config: Dict) -> Tuple[Problem, LogisticsDomain]:
         """Create a logistics problem with given topology configuration."""
         domain = LogisticsDomain(scale="small", auto_objects=False)
+        in_pile = domain.container_in_pile
+        on_top = domain.container_on_top_of_pile
+        under = domain.container_under_in_pile
         problem = Problem(f"topology_analysis_{config['name']}")
         
         # Create objects
@@ -165,7 +164,7 @@ class TopologyAnalysisExperiment:
         })
         
         # Add fluents
-        for fluent in domain.fluents + domain.static_fluents:
+        for fluent in chain(domain.fluents, domain.static_fluents):
             problem.add_fluent(fluent, default_initial_value=False)
         
         # Add actions
@@ -180,12 +179,9 @@ class TopologyAnalysisExperiment:
         for i, robot in enumerate(robots):
             dock = docks[i % len(docks)]
             initial_state[domain.robot_at(robot, dock)] = True
-            initial_state[domain.robot_can_carry_1(robot)] = True
-            initial_state[domain.robot_can_carry_2(robot)] = True
-            initial_state[domain.robot_can_carry_3(robot)] = False
+            initial_state.update(domain.slot_capacity(robot, 2))
             initial_state[domain.robot_capacity_6(robot)] = True
             initial_state[domain.robot_weight_0(robot)] = True
-            initial_state[domain.robot_free(robot)] = True
         
         # Container weights (mixed for interesting planning)
         for i, container in enumerate(containers):
@@ -206,19 +202,18 @@ class TopologyAnalysisExperiment:
             
             pile_containers = containers[start_idx:end_idx]
             for j, container in enumerate(pile_containers):
-                initial_state[domain.container_in_pile(container, pile)] = True
+                initial_state[in_pile(container, pile)] = True
                 if j == len(pile_containers) - 1:
-                    initial_state[domain.container_on_top_of_pile(container, pile)] = True
+                    initial_state[on_top(container, pile)] = True
                 if j > 0:
-                    initial_state[domain.container_under_in_pile(pile_containers[j-1], container, pile)] = True
+                    initial_state[under(pile_containers[j-1], container, pile)] = True
             
             dock = docks[i % len(docks)]
             initial_state[domain.pile_at_dock(pile, dock)] = True
         
-        # Set adjacency based on topology
+        # Set adjacency based on topology; connections() adds both directions
         adjacencies = self.create_adjacency(config)
-        for dock1_idx, dock2_idx in adjacencies:
-            initial_state[domain.adjacent(docks[dock1_idx], docks[dock2_idx])] = True
+        initial_state.update(domain.connections((docks[a], docks[b]) for a, b in adjacencies))
         
         # Set initial values
         for fluent, value in initial_state.items():
@@ -230,18 +225,18 @@ class TopologyAnalysisExperiment:
             # Goal: move containers to create a cross-topology pattern
             goal_conditions.extend([
                 # Move first container to last pile
-                domain.container_in_pile(containers[0], piles[-1]),
-                domain.container_on_top_of_pile(containers[0], piles[-1]),
+                in_pile(containers[0], piles[-1]),
+                on_top(containers[0], piles[-1]),
                 # Move second container to first pile
-                domain.container_in_pile(containers[1], piles[0]),
-                domain.container_on_top_of_pile(containers[1], piles[0]),
+                in_pile(containers[1], piles[0]),
+                on_top(containers[1], piles[0]),
                 # Move third container to middle pile
-                domain.container_in_pile(containers[2], piles[len(piles)//2]),
-                domain.container_on_top_of_pile(containers[2], piles[len(piles)//2])
+                in_pile(containers[2], piles[len(piles)//2]),
+                on_top(containers[2], piles[len(piles)//2])
             ])
         
-        if goal_conditions:
-            problem.add_goal(And(*goal_conditions))
+        for goal in goal_conditions:
+            problem.add_goal(goal)
         
         return problem, domain
     
@@ -258,10 +253,10 @@ class TopologyAnalysisExperiment:
             try:
                 problem, domain = self.create_problem(config)
                 
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 with OneshotPlanner(name='fast-downward') as planner:
                     result = planner.solve(problem)
-                solve_time = time.time() - start_time
+                solve_time = (time.perf_counter_ns() - start_time) / 1e9
                 
                 success = result.status == PlanGenerationResultStatus.SOLVED_SATISFICING
                 plan_length = len(result.plan.actions) if result.plan else 0
@@ -37,6 +37,11 @@ def run(
         False,
         "--list", "-l",
         help="List all available problems"
+    ),
+    optimal: bool = typer.Option(
+        False,
+        "--optimal",
+        help="Find a shortest plan with A* and an admissible heuristic (slower on large problems)"
     )
 ):
     """Run the logistics domain simulation with specified problem and planner."""
@@ -82,7 +87,7 @@ def run(
     ))
     
     # Solve and display
-    result = solver.solve_and_display(selected_problem, planner)
+    result = solver.solve_and_display(selected_problem, planner, optimal=optimal)
     
     if result:
         console.print("\n[bold green]🎉 Planning completed successfully![/bold green]")
@@ -3,7 +3,7 @@ Action definitions for the logistics domain.
 Implements load, unload, and move actions with proper preconditions and effects.
 """
 
-from unified_planning.shortcuts import *
+from unified_planning.shortcuts import And, InstantaneousAction, Not, Or
 from typing import List
 from .domain import LogisticsDomain
 
@@ -164,17 +164,6 @@ class LogisticsActions:
             )
         )
         
-        # Update robot_free status - robot is free only if no containers
-        pickup_action.add_effect(
-            self.domain.robot_free(robot), 
-            False,
-            condition=Or(
-                self.domain.robot_has_container_1(robot),
-                self.domain.robot_has_container_2(robot),
-                self.domain.robot_has_container_3(robot)
-            )
-        )
-        
         # Update robot weight levels - define all weight combinations explicitly
         # Pick up 2t container when robot has 0t -> robot now has 2t
         pickup_action.add_effect(self.domain.robot_weight_0(robot), False, 
@@ -220,21 +209,17 @@ class LogisticsActions:
         # Get all containers dynamically from domain objects
         domain_objects = self.domain.get_domain_objects()
         containers = domain_objects["containers"]
+        on_top_of_pile = self.domain.container_on_top_of_pile
+        under_in_pile = self.domain.container_under_in_pile
+        add_effect = pickup_action.add_effect
         
         for other_container in containers:
             if other_container != container:
+                was_under = under_in_pile(other_container, container, pile)
                 # If other_container was under this container, it becomes the new top
-                pickup_action.add_effect(
-                    self.domain.container_on_top_of_pile(other_container, pile),
-                    True,
-                    condition=self.domain.container_under_in_pile(other_container, container, pile)
-                )
+                add_effect(on_top_of_pile(other_container, pile), True, condition=was_under)
                 # Remove the under relationship
-                pickup_action.add_effect(
-                    self.domain.container_under_in_pile(other_container, container, pile),
-                    False,
-                    condition=self.domain.container_under_in_pile(other_container, container, pile)
-                )
+                add_effect(was_under, False, condition=was_under)
         
         self.actions.append(pickup_action)
     
@@ -307,17 +292,6 @@ class LogisticsActions:
             condition=self.domain.container_in_robot_slot_1(robot, container)
         )
         
-        # Update robot_free status - robot is free if no containers
-        putdown_action.add_effect(
-            self.domain.robot_free(robot), 
-            True,
-            condition=And(
-                Not(self.domain.robot_has_container_1(robot)),
-                Not(self.domain.robot_has_container_2(robot)),
-                Not(self.domain.robot_has_container_3(robot))
-            )
-        )
-        
         # Update robot weight levels - define all weight combinations explicitly
         # Put down 2t container when robot has 2t -> robot now has 0t
         putdown_action.add_effect(self.domain.robot_weight_2(robot), False, 
@@ -363,21 +337,17 @@ class LogisticsActions:
         # Get all containers dynamically from domain objects
         domain_objects = self.domain.get_domain_objects()
         containers = domain_objects["containers"]
+        on_top_of_pile = self.domain.container_on_top_of_pile
+        under_in_pile = self.domain.container_under_in_pile
+        add_effect = putdown_action.add_effect
         
         for other_container in containers:
             if other_container != container:
+                was_on_top = on_top_of_pile(other_container, pile)
                 # If other_container was on top, it's no longer on top
-                putdown_action.add_effect(
-                    self.domain.container_on_top_of_pile(other_container, pile),
-                    False,
-                    condition=self.domain.container_on_top_of_pile(other_container, pile)
-                )
+                add_effect(was_on_top, False, condition=was_on_top)
                 # This container is now on top of the other container
-                putdown_action.add_effect(
-                    self.domain.container_under_in_pile(other_container, container, pile),
-                    True,
-                    condition=self.domain.container_on_top_of_pile(other_container, pile)
-                )
+                add_effect(under_in_pile(other_container, container, pile), True, condition=was_on_top)
         
         self.actions.append(putdown_action)
     
@@ -3,10 +3,31 @@ Domain definition for Example 2.3 - Logistics domain with robots, docks, contain
 Based on Figure 2.3 from "Automated Planning and Acting" by Ghallab, Nau, and Traverso.
 """
 
-from unified_planning.shortcuts import *
+from unified_planning.shortcuts import BoolType, Fluent, UserType
 from typing import Dict, Set, Tuple
 
 
+class CachedFluent(Fluent):
+    """Fluent whose applications are memoized per argument tuple.
+
+    Demos and actions ground the same fluent on the same arguments many times
+    (initial state, goals, preconditions, effects). Returning the canonical
+    expression from a per-fluent cache skips UP's expression-manager dispatch
+    on every repeated call.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._expression_cache = {}
+
+    def __call__(self, *args):
+        expression = self._expression_cache.get(args)
+        if expression is None:
+            expression = super().__call__(*args)
+            self._expression_cache[args] = expression
+        return expression
+
+
 class LogisticsDomain:
     """Logistics domain with robots, docks, containers, and piles."""
     
@@ -34,6 +55,9 @@ class LogisticsDomain:
         
         Expected keys: 'robots', 'docks', 'containers', 'piles', 'all_objects'.
         Only the presence of 'containers' is required by current actions.
+        The dict is read a few times per problem build (actions look up
+        'containers' once per schema), so it stays a plain dict rather than
+        a NamedTuple; demos, display utilities and experiments share it.
         """
         if not isinstance(objects_dict, dict):
             raise ValueError("assign_objects expects a dictionary of object lists")
@@ -55,73 +79,72 @@ class LogisticsDomain:
     
     def _setup_fluents(self):
         """Define the state variables (fluents) for the domain."""
-        # Robot state (boolean fluents for PDDL compatibility)
-        self.robot_at = Fluent("robot_at", BoolType(), robot=self.Robot, dock=self.Dock)
-        self.robot_carrying = Fluent("robot_carrying", BoolType(), robot=self.Robot, container=self.Container)
-        self.robot_free = Fluent("robot_free", BoolType(), robot=self.Robot)
+        # Robot state (boolean fluents for PDDL compatibility).
+        # A robot is free exactly when Not(robot_has_container_1/2/3) holds, so no separate flag is kept.
+        self.robot_at = CachedFluent("robot_at", BoolType(), robot=self.Robot, dock=self.Dock)
+        self.robot_carrying = CachedFluent("robot_carrying", BoolType(), robot=self.Robot, container=self.Container)
         
         # Robot capacity system (simplified with boolean fluents)
-        self.robot_can_carry_1 = Fluent("robot_can_carry_1", BoolType(), robot=self.Robot)
-        self.robot_can_carry_2 = Fluent("robot_can_carry_2", BoolType(), robot=self.Robot)
-        self.robot_can_carry_3 = Fluent("robot_can_carry_3", BoolType(), robot=self.Robot)
+        self.robot_can_carry_1 = CachedFluent("robot_can_carry_1", BoolType(), robot=self.Robot)
+        self.robot_can_carry_2 = CachedFluent("robot_can_carry_2", BoolType(), robot=self.Robot)
+        self.robot_can_carry_3 = CachedFluent("robot_can_carry_3", BoolType(), robot=self.Robot)
         
         # Robot load tracking (simplified)
-        self.robot_has_container_1 = Fluent("robot_has_container_1", BoolType(), robot=self.Robot)
-        self.robot_has_container_2 = Fluent("robot_has_container_2", BoolType(), robot=self.Robot)
-        self.robot_has_container_3 = Fluent("robot_has_container_3", BoolType(), robot=self.Robot)
+        self.robot_has_container_1 = CachedFluent("robot_has_container_1", BoolType(), robot=self.Robot)
+        self.robot_has_container_2 = CachedFluent("robot_has_container_2", BoolType(), robot=self.Robot)
+        self.robot_has_container_3 = CachedFluent("robot_has_container_3", BoolType(), robot=self.Robot)
         
         # Track which specific container is in each slot (for LIFO enforcement)
-        self.container_in_robot_slot_1 = Fluent("container_in_robot_slot_1", BoolType(), robot=self.Robot, container=self.Container)
-        self.container_in_robot_slot_2 = Fluent("container_in_robot_slot_2", BoolType(), robot=self.Robot, container=self.Container)
-        self.container_in_robot_slot_3 = Fluent("container_in_robot_slot_3", BoolType(), robot=self.Robot, container=self.Container)
+        self.container_in_robot_slot_1 = CachedFluent("container_in_robot_slot_1", BoolType(), robot=self.Robot, container=self.Container)
+        self.container_in_robot_slot_2 = CachedFluent("container_in_robot_slot_2", BoolType(), robot=self.Robot, container=self.Container)
+        self.container_in_robot_slot_3 = CachedFluent("container_in_robot_slot_3", BoolType(), robot=self.Robot, container=self.Container)
         
         # Container state
-        self.container_in_pile = Fluent("container_in_pile", BoolType(), container=self.Container, pile=self.Pile)
-        self.container_on_top_of_pile = Fluent("container_on_top_of_pile", BoolType(), container=self.Container, pile=self.Pile)
-        self.container_under_in_pile = Fluent("container_under_in_pile", BoolType(), container=self.Container, other_container=self.Container, pile=self.Pile)
+        self.container_in_pile = CachedFluent("container_in_pile", BoolType(), container=self.Container, pile=self.Pile)
+        self.container_on_top_of_pile = CachedFluent("container_on_top_of_pile", BoolType(), container=self.Container, pile=self.Pile)
+        self.container_under_in_pile = CachedFluent("container_under_in_pile", BoolType(), container=self.Container, other_container=self.Container, pile=self.Pile)
         
         # Container weight system (boolean weight levels approach)
-        self.container_weight_2 = Fluent("container_weight_2", BoolType(), container=self.Container)
-        self.container_weight_4 = Fluent("container_weight_4", BoolType(), container=self.Container)
-        self.container_weight_6 = Fluent("container_weight_6", BoolType(), container=self.Container)
+        self.container_weight_2 = CachedFluent("container_weight_2", BoolType(), container=self.Container)
+        self.container_weight_4 = CachedFluent("container_weight_4", BoolType(), container=self.Container)
+        self.container_weight_6 = CachedFluent("container_weight_6", BoolType(), container=self.Container)
         
         # Robot weight level system (boolean approach for numerical weights)
-        self.robot_weight_0 = Fluent("robot_weight_0", BoolType(), robot=self.Robot)
-        self.robot_weight_2 = Fluent("robot_weight_2", BoolType(), robot=self.Robot)
-        self.robot_weight_4 = Fluent("robot_weight_4", BoolType(), robot=self.Robot)
-        self.robot_weight_6 = Fluent("robot_weight_6", BoolType(), robot=self.Robot)
-        self.robot_weight_8 = Fluent("robot_weight_8", BoolType(), robot=self.Robot)
-        self.robot_weight_10 = Fluent("robot_weight_10", BoolType(), robot=self.Robot)
+        self.robot_weight_0 = CachedFluent("robot_weight_0", BoolType(), robot=self.Robot)
+        self.robot_weight_2 = CachedFluent("robot_weight_2", BoolType(), robot=self.Robot)
+        self.robot_weight_4 = CachedFluent("robot_weight_4", BoolType(), robot=self.Robot)
+        self.robot_weight_6 = CachedFluent("robot_weight_6", BoolType(), robot=self.Robot)
+        self.robot_weight_8 = CachedFluent("robot_weight_8", BoolType(), robot=self.Robot)
+        self.robot_weight_10 = CachedFluent("robot_weight_10", BoolType(), robot=self.Robot)
         
         # Robot capacity levels
-        self.robot_capacity_5 = Fluent("robot_capacity_5", BoolType(), robot=self.Robot)
-        self.robot_capacity_6 = Fluent("robot_capacity_6", BoolType(), robot=self.Robot)
-        self.robot_capacity_8 = Fluent("robot_capacity_8", BoolType(), robot=self.Robot)
-        self.robot_capacity_10 = Fluent("robot_capacity_10", BoolType(), robot=self.Robot)
-        
-        # Pile state
-        self.pile_at_dock = Fluent("pile_at_dock", BoolType(), pile=self.Pile, dock=self.Dock)
+        self.robot_capacity_5 = CachedFluent("robot_capacity_5", BoolType(), robot=self.Robot)
+        self.robot_capacity_6 = CachedFluent("robot_capacity_6", BoolType(), robot=self.Robot)
+        self.robot_capacity_8 = CachedFluent("robot_capacity_8", BoolType(), robot=self.Robot)
+        self.robot_capacity_10 = CachedFluent("robot_capacity_10", BoolType(), robot=self.Robot)
         
         # All fluents list
         self.fluents = [
-            self.robot_at, self.robot_carrying, self.robot_free,
+            self.robot_at, self.robot_carrying,
             self.robot_can_carry_1, self.robot_can_carry_2, self.robot_can_carry_3,
             self.robot_has_container_1, self.robot_has_container_2, self.robot_has_container_3,
             self.container_in_robot_slot_1, self.container_in_robot_slot_2, self.container_in_robot_slot_3,
             self.container_in_pile, self.container_on_top_of_pile, self.container_under_in_pile,
             self.container_weight_2, self.container_weight_4, self.container_weight_6,
             self.robot_weight_0, self.robot_weight_2, self.robot_weight_4, self.robot_weight_6, self.robot_weight_8, self.robot_weight_10,
-            self.robot_capacity_5, self.robot_capacity_6, self.robot_capacity_8, self.robot_capacity_10,
-            self.pile_at_dock
+            self.robot_capacity_5, self.robot_capacity_6, self.robot_capacity_8, self.robot_capacity_10
         ]
     
     def _setup_static_relations(self):
         """Define static relations (rigid properties)."""
         # Adjacent docks
-        self.adjacent = Fluent("adjacent", BoolType(), dock1=self.Dock, dock2=self.Dock)
+        self.adjacent = CachedFluent("adjacent", BoolType(), dock1=self.Dock, dock2=self.Dock)
+        
+        # Pile locations: static, so only pickup/putdown at a pile's own dock are grounded
+        self.pile_at_dock = CachedFluent("pile_at_dock", BoolType(), pile=self.Pile, dock=self.Dock)
         
         # All static fluents
-        self.static_fluents = [self.adjacent]
+        self.static_fluents = [self.adjacent, self.pile_at_dock]
     
     def get_domain_objects(self) -> Dict[str, list]:
         """Return organized domain objects for problem creation."""
@@ -129,6 +152,34 @@ class LogisticsDomain:
             return self._assigned_objects
         raise ValueError("No domain objects available. Call assign_objects() in your demo to provide objects.")
     
+    def slot_capacity(self, robot, slots: int) -> Dict:
+        """Return the initial-state facts giving a robot the given number of carrying slots.
+
+        Capacity is exposed as a single value per robot, but is encoded with the
+        cumulative robot_can_carry_1/2/3 booleans so problems stay within the
+        classical fragment Fast Downward accepts. Only the True facts are
+        returned; the higher levels keep the problem's False default.
+        """
+        can_carry = (self.robot_can_carry_1, self.robot_can_carry_2, self.robot_can_carry_3)
+        if not 1 <= slots <= len(can_carry):
+            raise ValueError(f"Robot slot capacity must be between 1 and {len(can_carry)}, got {slots}")
+        return {fluent(robot): True for fluent in can_carry[:slots]}
+
+    def connections(self, edges) -> Dict:
+        """Return the initial-state facts connecting each (dock, dock) edge in both directions.
+
+        Docks are always linked symmetrically, so scenarios list every edge once
+        and adjacent() is filled in for both orientations. adjacent stays a
+        static fluent: Fast Downward compiles it away during translation, which
+        a derived symmetric predicate would not improve on. List only the
+        connections a scenario needs: each one grounds more move actions.
+        """
+        facts = {}
+        for a, b in edges:
+            facts[self.adjacent(a, b)] = True
+            facts[self.adjacent(b, a)] = True
+        return facts
+
     def get_fluents(self) -> list:
         """Return all fluents defined in the domain."""
         return self.fluents + self.static_fluents
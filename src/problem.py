@@ -3,7 +3,8 @@ Problem setup and initial state for the logistics domain.
 Creates planning problems with different goals for testing.
 """
 
-from unified_planning.shortcuts import *
+from itertools import chain
+from unified_planning.shortcuts import Equals, Problem
 from typing import Dict, List, Any
 from .domain import LogisticsDomain
 from .actions import LogisticsActions
@@ -26,7 +27,7 @@ class LogisticsProblem:
         self.problem.add_objects(self.domain.objects)
         
         # Add fluents
-        for fluent in self.domain.fluents + self.domain.static_fluents:
+        for fluent in chain(self.domain.fluents, self.domain.static_fluents):
             self.problem.add_fluent(fluent, default_initial_value=False)
         
         # Add actions
@@ -63,14 +64,10 @@ class LogisticsProblem:
     
     def create_complex_goal(self, goals: List[Any]) -> None:
         """Create a complex goal with multiple conditions."""
-        if len(goals) == 1:
-            self.add_goal(goals[0])
-        else:
-            # Combine multiple goals with AND
-            combined_goal = goals[0]
-            for goal in goals[1:]:
-                combined_goal = And(combined_goal, goal)
-            self.add_goal(combined_goal)
+        # Problem goals are already a conjunction, so each condition is added on
+        # its own instead of through a chain of nested binary And nodes
+        for goal in goals:
+            self.add_goal(goal)
     
     def get_problem(self) -> Problem:
         """Return the current problem."""
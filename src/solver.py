@@ -3,8 +3,8 @@ Planning solver with rich console output for the logistics domain.
 Provides beautiful visualization of the planning process and results.
 """
 
-from unified_planning.shortcuts import *
-from unified_planning.engines import PlanGenerationResult
+from unified_planning.shortcuts import OneshotPlanner, Problem
+from unified_planning.engines import PlanGenerationResult, PlanGenerationResultStatus
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -14,6 +14,9 @@ from rich.align import Align
 from typing import Dict, List, Any, Optional
 import time
 
+from utils.display import plan_steps
+from utils.fast_downward import FAST_DOWNWARD_OPTIMAL_SEARCH, solve_with_fast_downward
+
 
 class LogisticsSolver:
     """Planning solver with rich console output for the logistics domain."""
@@ -22,7 +25,8 @@ class LogisticsSolver:
         self.console = Console()
         self.available_planners = ["pyperplan", "fast-downward"]
     
-    def solve_problem(self, problem: Problem, planner_name: str = "pyperplan", heuristic: str = "default") -> Optional[PlanGenerationResult]:
+    def solve_problem(self, problem: Problem, planner_name: str = "pyperplan", heuristic: str = "default",
+                      optimal: bool = False) -> Optional[PlanGenerationResult]:
         """
         Solve a planning problem using the specified planner and heuristic.
         
@@ -30,6 +34,7 @@ class LogisticsSolver:
             problem: The planning problem to solve
             planner_name: Name of the planner to use
             heuristic: Heuristic to use for Fast Downward
+            optimal: Search for a shortest plan with A* and an admissible heuristic (Fast Downward only)
             
         Returns:
             PlanGenerationResult if successful, None otherwise
@@ -42,37 +47,64 @@ class LogisticsSolver:
             # Use fast-downward instead of pyperplan for equality support
             planner_name = 'fast-downward' if planner_name == 'pyperplan' else planner_name
             
+            # Exactly one configuration runs per call, with no fallback chain, so there
+            # are no attempts to race; callers that solve many problems (run_all, the
+            # multi-robot example) already spread them over worker processes
+            
+            if planner_name == 'fast-downward' and optimal:
+                start_time = time.perf_counter_ns()
+                result = solve_with_fast_downward(problem, search=FAST_DOWNWARD_OPTIMAL_SEARCH, optimal=True)
+                solve_time = (time.perf_counter_ns() - start_time) / 1e9
+                return self._handle_result(result, solve_time, "optimal")
+
             # Configure Fast Downward with specific heuristics for logistics
             if planner_name == 'fast-downward' and heuristic != "default":
-                # Try different heuristics that work well for logistics problems
+                # Try different heuristics that work well for logistics problems.
+                # FF is only paired with greedy search: under A* it is inadmissible,
+                # so it neither guarantees shortest plans nor keeps GBFS's speed
                 heuristics_config = {
-                    "h_ff": "--search 'astar(ff())'",
-                    "h_add": "--search 'astar(add())'", 
-                    "h_max": "--search 'astar(max())'",
-                    "h_lmcut": "--search 'astar(lmcut())'",
-                    "h_cea": "--search 'astar(cea())'",
-                    "h_cg": "--search 'astar(cg())'",
-                    "h_goalcount": "--search 'astar(goalcount())'",
-                    "gbfs_ff": "--search 'eager_greedy([ff()])'",
-                    "gbfs_add": "--search 'eager_greedy([add()])'",
-                    "gbfs_cea": "--search 'eager_greedy([cea()])'"
+                    "h_add": "astar(add())",
+                    "h_max": "astar(hmax())",
+                    "h_cea": "astar(cea())",
+                    "h_cg": "astar(cg())",
+                    "h_goalcount": "astar(goalcount())",
+                    "gbfs_ff": "eager_greedy([ff()])",
+                    "gbfs_add": "eager_greedy([add()])",
+                    "gbfs_cea": "eager_greedy([cea()])"
                 }
                 
-                if heuristic in heuristics_config:
-                    # Use the specific heuristic configuration
-                    with OneshotPlanner(name=planner_name, params=heuristics_config[heuristic]) as planner:
-                        start_time = time.time()
-                        result = planner.solve(problem)
-                        solve_time = time.time() - start_time
-                        return self._handle_result(result, solve_time, heuristic)
+                # Heuristics Fast Downward rejects on this domain, with the reason
+                unsupported_heuristics = {
+                    "h_ff": "A* with FF was removed since FF is inadmissible; use gbfs_ff for greedy search",
+                    "h_lmcut": "LM-cut does not support the conditional effects of pickup and putdown",
+                }
+                
+                if heuristic in unsupported_heuristics:
+                    self.console.print(f"[red]❌ Heuristic '{heuristic}' is not supported: {unsupported_heuristics[heuristic]}[/red]")
+                    return None
+                elif heuristic in heuristics_config:
+                    # The translation cache is keyed on the PDDL alone, so trying several
+                    # heuristics on one problem translates it only once
+                    start_time = time.perf_counter_ns()
+                    search = heuristics_config[heuristic]
+                    result = solve_with_fast_downward(problem, search=search,
+                                                      optimal=search == FAST_DOWNWARD_OPTIMAL_SEARCH)
+                    solve_time = (time.perf_counter_ns() - start_time) / 1e9
+                    return self._handle_result(result, solve_time, heuristic)
                 else:
                     self.console.print(f"[yellow]⚠️ Unknown heuristic '{heuristic}', using default[/yellow]")
             
-            # Default planner configuration
+            # Default configuration: one lazy greedy FF run with preferred operators,
+            # through the driver directly so translations are cached across runs
+            if planner_name == 'fast-downward':
+                start_time = time.perf_counter_ns()
+                result = solve_with_fast_downward(problem)
+                solve_time = (time.perf_counter_ns() - start_time) / 1e9
+                return self._handle_result(result, solve_time, "default")
             with OneshotPlanner(name=planner_name) as planner:
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 result = planner.solve(problem)
-                solve_time = time.time() - start_time
+                solve_time = (time.perf_counter_ns() - start_time) / 1e9
                 return self._handle_result(result, solve_time, "default")
                     
         except Exception as e:
@@ -93,6 +125,8 @@ class LogisticsSolver:
             return result
         else:
             self.console.print(f"[red]❌ Planning failed: {result.status}[/red]")
+            for log_message in result.log_messages or []:
+                self.console.print(log_message.message, style="dim", markup=False)
             if heuristic != "default":
                 self.console.print(f"[red]🎯 Heuristic '{heuristic}' failed[/red]")
             return None
@@ -240,10 +274,9 @@ class LogisticsSolver:
         plan_table.add_column("Action", style="white")
         plan_table.add_column("Parameters", style="yellow")
         
-        for i, action in enumerate(result.plan.actions, 1):
-            action_name = action.action.name
-            params = ", ".join([str(param) for param in action.actual_parameters])
-            plan_table.add_row(str(i), action_name, params)
+        rows = [(str(i), step.name, ", ".join(step.params)) for i, step in enumerate(plan_steps(result.plan), 1)]
+        for row in rows:
+            plan_table.add_row(*row)
         
         self.console.print(plan_table)
         
@@ -275,13 +308,14 @@ class LogisticsSolver:
         
         self.console.print(summary_table)
     
-    def solve_and_display(self, problem: Problem, planner_name: str = "pyperplan") -> Optional[PlanGenerationResult]:
+    def solve_and_display(self, problem: Problem, planner_name: str = "pyperplan", optimal: bool = False) -> Optional[PlanGenerationResult]:
         """
         Solve a problem and display all information in a beautiful format.
         
         Args:
             problem: The planning problem to solve
             planner_name: Name of the planner to use
+            optimal: Search for a shortest plan instead of the first one found
             
         Returns:
             PlanGenerationResult if successful, None otherwise
@@ -299,9 +333,9 @@ class LogisticsSolver:
         self.console.print()
         
         # Solve the problem
-        start_time = time.time()
-        result = self.solve_problem(problem, planner_name)
-        solve_time = time.time() - start_time
+        start_time = time.perf_counter_ns()
+        result = self.solve_problem(problem, planner_name, optimal=optimal)
+        solve_time = (time.perf_counter_ns() - start_time) / 1e9
         
         # Display results
         if result:
@@ -0,0 +1,159 @@
+"""
+Breadth-first search over packed bitset states for logistics problems.
+Used when the Fast Downward driver is not installed: the problem is grounded
+in Python and searched with every state held in a single int.
+"""
+
+import itertools
+from collections import deque
+from typing import Dict, FrozenSet, List, Tuple
+
+from unified_planning.engines import PlanGenerationResult, PlanGenerationResultStatus
+from unified_planning.model import FNode, Problem
+from unified_planning.plans import ActionInstance, SequentialPlan
+
+# A condition in disjunctive normal form: it holds when, for any (pos, neg) pair,
+# every bit of pos is set and no bit of neg is
+Condition = Tuple[Tuple[int, int], ...]
+
+_TRUE: Condition = ((0, 0),)
+_FALSE: Condition = ()
+
+
+class _Grounder:
+    """Compile ground conditions to DNF bitmasks, assigning one bit per dynamic fluent expression.
+
+    Static fluents (those no action modifies) are replaced by their initial
+    value, so pile_at_dock and adjacent prune groundings instead of taking
+    bits. Conditions may use And, Or and negated fluents, which covers the
+    disjunctive preconditions and conditional effects of the logistics actions.
+    """
+
+    def __init__(self, problem: Problem):
+        self.initial_true: FrozenSet[FNode] = frozenset(
+            fluent for fluent, value in problem.initial_values.items() if value.bool_constant_value()
+        )
+        self.dynamic = {effect.fluent.fluent() for action in problem.actions for effect in action.effects}
+        self.bits: Dict[FNode, int] = {}
+
+    def bit(self, fluent_exp: FNode) -> int:
+        index = self.bits.get(fluent_exp)
+        if index is None:
+            index = self.bits[fluent_exp] = len(self.bits)
+        return 1 << index
+
+    def condition(self, expression: FNode) -> Condition:
+        if expression.is_bool_constant():
+            return _TRUE if expression.bool_constant_value() else _FALSE
+        if expression.is_fluent_exp():
+            if expression.fluent() not in self.dynamic:
+                return _TRUE if expression in self.initial_true else _FALSE
+            return ((self.bit(expression), 0),)
+        if expression.is_not() and expression.arg(0).is_fluent_exp():
+            inner = expression.arg(0)
+            if inner.fluent() not in self.dynamic:
+                return _FALSE if inner in self.initial_true else _TRUE
+            return ((0, self.bit(inner)),)
+        if expression.is_and():
+            result = _TRUE
+            for arg in expression.args:
+                other = self.condition(arg)
+                # Drop contradictory conjunctions as they are formed
+                result = tuple((p1 | p2, n1 | n2) for p1, n1 in result for p2, n2 in other
+                               if not (p1 | p2) & (n1 | n2))
+                if not result:
+                    return _FALSE
+            return result
+        if expression.is_or():
+            return tuple(disjunct for arg in expression.args for disjunct in self.condition(arg))
+        raise ValueError(f"Unsupported condition for bitset search: {expression}")
+
+
+def _holds(state: int, condition: Condition) -> bool:
+    for pos, neg in condition:
+        if state & pos == pos and not state & neg:
+            return True
+    return False
+
+
+def solve_with_bitset_bfs(problem: Problem) -> PlanGenerationResult:
+    """
+    Find a shortest plan by breadth-first search over bitset-encoded states.
+
+    Each action is grounded on every combination of objects and kept when its
+    precondition can hold; a successor is then (state & ~deletes) | adds, with
+    conditional effects evaluated in the current state. Only boolean fluents
+    and conditions built from And, Or and Not are supported, as in the
+    logistics domain.
+
+    Args:
+        problem: The planning problem to solve
+
+    Returns:
+        PlanGenerationResult with a shortest plan, or UNSOLVABLE_PROVEN once
+        every reachable state has been expanded. Solved results are reported
+        as SOLVED_SATISFICING, like the Fast Downward path, so callers need
+        not tell the two apart.
+    """
+    environment = problem.environment
+    em = environment.expression_manager
+    substitute = environment.substituter.substitute
+    grounder = _Grounder(problem)
+
+    # (precondition, adds, deletes, conditional effects, action instance)
+    operators: List[Tuple[Condition, int, int, Tuple[Tuple[Condition, int, bool], ...], ActionInstance]] = []
+    for action in problem.actions:
+        precondition = em.And(action.preconditions)
+        domains = [list(problem.objects(parameter.type)) for parameter in action.parameters]
+        for objects in itertools.product(*domains):
+            binding = {parameter: em.ObjectExp(obj) for parameter, obj in zip(action.parameters, objects)}
+            condition = grounder.condition(substitute(precondition, binding))
+            if not condition:
+                continue
+            adds = deletes = 0
+            conditional = []
+            for effect in action.effects:
+                bit = grounder.bit(substitute(effect.fluent, binding))
+                value = effect.value.bool_constant_value()
+                if effect.is_conditional():
+                    effect_condition = grounder.condition(substitute(effect.condition, binding))
+                    if effect_condition:
+                        conditional.append((effect_condition, bit, value))
+                elif value:
+                    adds |= bit
+                else:
+                    deletes |= bit
+            operators.append((condition, adds, deletes, tuple(conditional), ActionInstance(action, objects)))
+
+    initial = 0
+    for fluent_exp in grounder.initial_true:
+        if fluent_exp.fluent() in grounder.dynamic:
+            initial |= grounder.bit(fluent_exp)
+    goal = grounder.condition(em.And(problem.goals))
+
+    parents = {initial: None}
+    queue = deque([initial])
+    while queue:
+        state = queue.popleft()
+        if _holds(state, goal):
+            actions = []
+            while parents[state] is not None:
+                state, instance = parents[state]
+                actions.append(instance)
+            plan = SequentialPlan(actions[::-1], environment)
+            return PlanGenerationResult(PlanGenerationResultStatus.SOLVED_SATISFICING, plan, "bitset-bfs")
+        for condition, adds, deletes, conditional, instance in operators:
+            if not _holds(state, condition):
+                continue
+            for effect_condition, bit, value in conditional:
+                if _holds(state, effect_condition):
+                    if value:
+                        adds |= bit
+                    else:
+                        deletes |= bit
+            # Deletes first, so an atom that is both deleted and added ends up true
+            successor = (state & ~deletes) | adds
+            if successor not in parents:
+                parents[successor] = (state, instance)
+                queue.append(successor)
+    return PlanGenerationResult(PlanGenerationResultStatus.UNSOLVABLE_PROVEN, None, "bitset-bfs")
@@ -3,14 +3,143 @@ Display utilities for logistics planning scenarios.
 Provides rich console output for distributions, plans, and domain information.
 """
 
+import os
+from dataclasses import dataclass
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from typing import Dict, List, Tuple, Any
+from typing import Callable, Dict, List, Tuple, Any, Optional, Union
 from unified_planning.model import Problem, Fluent
 from unified_planning.model.object import Object
 
-console = Console()
+
+class QuietConsole:
+    """Stand-in for a rich Console that discards everything printed to it."""
+
+    def print(self, *args, **kwargs) -> None:
+        pass
+
+
+class LazyConsole:
+    """Stand-in for a rich Console that creates it on first use.
+
+    Modules create their console at import time; deferring rich's terminal
+    and color detection keeps importing a demo (e.g. in a run_all worker or
+    before --quiet is parsed) free of it.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not set on the instance; going through
+        # __dict__ keeps copies made without __init__ from recursing here
+        console = self.__dict__.get("_console")
+        if console is None:
+            console = self.__dict__["_console"] = Console()
+        return getattr(console, name)
+
+
+def make_console(quiet: Optional[bool] = None) -> Union[LazyConsole, QuietConsole]:
+    """
+    Create the console used for demo output.
+
+    The rich Console itself is only created when something is printed.
+
+    Args:
+        quiet: Discard all output; defaults to whether LOGISTICS_QUIET is set,
+            so batch and benchmark runs skip rich's markup and layout work.
+            Colors alone are still controlled by rich's own NO_COLOR handling.
+    """
+    if quiet is None:
+        quiet = bool(os.environ.get("LOGISTICS_QUIET"))
+    return QuietConsole() if quiet else LazyConsole()
+
+
+def set_quiet(quiet: bool = True) -> Union[LazyConsole, QuietConsole]:
+    """Switch LogisticsDisplay output on or off and return the console now in use."""
+    global console
+    console = make_console(quiet)
+    return console
+
+
+console = make_console()
+
+
+def print_scenario(render: Callable[[], None]) -> None:
+    """
+    Print tables that only restate the scenario definition.
+
+    render prints through LogisticsDisplay. Nothing is built when output is
+    redirected (benchmarks, CI logs) unless FORCE_RICH is set.
+    """
+    if isinstance(console, QuietConsole):
+        return
+    if not (console.is_terminal or os.environ.get("FORCE_RICH")):
+        return
+    render()
+
+
+# Boolean weight levels of the logistics domain (container_weight_<n>, robot_weight_<n>)
+_CONTAINER_WEIGHTS = (2, 4, 6)
+_ROBOT_WEIGHTS = (0, 2, 4, 6, 8, 10)
+
+# Plan step formatters: action name -> ((stringified parameters, task) -> (details, purpose))
+_FMT = {
+    "move": lambda p, task: (f"{p[0]}: {p[1]} → {p[2]}", "Navigate to target location"),
+    "pickup": lambda p, task: (f"{p[0]} picks {p[1]} from {p[2]} at {p[3]}", f"Collect {p[1]} for {task}"),
+    "putdown": lambda p, task: (f"{p[0]} puts {p[1]} on {p[2]} at {p[3]}", f"Deliver {p[1]} to target pile"),
+}
+
+
+def _fmt_default(params: Tuple[str, ...], task: str) -> Tuple[str, str]:
+    return ", ".join(params), "Execute action"
+
+
+@dataclass(frozen=True, slots=True)
+class PlanStep:
+    """A plan action reduced to its name and stringified parameters."""
+    name: str
+    params: Tuple[str, ...]
+
+
+def plan_steps(plan) -> List[PlanStep]:
+    """Convert a plan's actions to PlanStep records once, so display loops never touch UP objects."""
+    return [PlanStep(action.action.name, tuple(map(str, action.actual_parameters))) for action in plan.actions]
+
+
+def format_step(step: PlanStep, task: str) -> Tuple[str, str]:
+    """Describe a plan step as (details, purpose); task names what pickups collect containers for."""
+    return _FMT.get(step.name, _fmt_default)(step.params, task)
+
+
+def _replay_plan(problem: Problem, plan) -> List[Any]:
+    """
+    Return the states visited by a sequential plan, starting with the initial state.
+    
+    Steps from the first inapplicable action onwards are reported as None.
+    """
+    from unified_planning.shortcuts import SequentialSimulator
+    
+    with SequentialSimulator(problem) as simulator:
+        states = [simulator.get_initial_state()]
+        for action in plan.actions:
+            state = states[-1]
+            states.append(simulator.apply(state, action) if state is not None else None)
+    return states
+
+
+def _level_fluents(problem: Problem, prefix: str, levels: Tuple[int, ...]) -> Tuple[Tuple[str, Fluent], ...]:
+    """Look up the <prefix>_<n> boolean level fluents once, paired with their "<n>t" labels."""
+    return tuple((f"{level}t", problem.fluent(f"{prefix}_{level}")) for level in levels)
+
+
+def _level(value_of: Optional[Callable[[Any], Any]], level_fluents: Tuple[Tuple[str, Fluent], ...], obj) -> str:
+    """Read which level from _level_fluents holds for obj, given a state's (or the initial state's) value lookup."""
+    if value_of is None:
+        return "?"
+    for label, fluent in level_fluents:
+        if value_of(fluent(obj)).bool_constant_value():
+            return label
+    return "?"
 
 
 class LogisticsDisplay:
@@ -163,30 +292,29 @@ class LogisticsDisplay:
         plan_table.add_column("Details", style="green")
         plan_table.add_column("Purpose", style="blue")
         
-        for i, action in enumerate(plan_result.plan.actions, 1):
-            action_name = action.action.name
-            params = [str(p) for p in action.actual_parameters]
-            
-            if action_name == "move":
-                robot_param, from_dock, to_dock = params
-                details = f"{robot_param}: {from_dock} → {to_dock}"
-                purpose = "Navigate to target location"
-            elif action_name == "pickup":
-                robot_param, container, pile, dock = params
-                details = f"{robot_param} picks {container} from {pile} at {dock}"
-                purpose = f"Collect {container} for redistribution"
-            elif action_name == "putdown":
-                robot_param, container, pile, dock = params
-                details = f"{robot_param} puts {container} on {pile} at {dock}"
-                purpose = f"Deliver {container} to target pile"
-            else:
-                details = ", ".join(params)
-                purpose = "Execute action"
-            
-            plan_table.add_row(str(i), action_name, params[0] if params else "?", details, purpose)
+        rows = [
+            (str(i), step.name, step.params[0] if step.params else "?", *format_step(step, "redistribution"))
+            for i, step in enumerate(plan_steps(plan_result.plan), 1)
+        ]
+        for row in rows:
+            plan_table.add_row(*row)
         
         console.print(plan_table)
     
+    @staticmethod
+    def display_plan_plain(plan_result, title: str = "Plan"):
+        """Print a plan as numbered plain-text lines, without rich markup or layout; silent when quiet."""
+        if isinstance(console, QuietConsole):
+            return
+        if not plan_result or not plan_result.plan:
+            print(f"{title}: no plan found")
+            return
+        
+        steps = plan_steps(plan_result.plan)
+        print(f"{title} ({len(steps)} steps)")
+        for i, step in enumerate(steps, 1):
+            print(f"{i}: {step.name}({', '.join(step.params)})")
+    
     @staticmethod
     def display_plan_summary(plan_result, solve_time: float, description: str = "Planning Summary"):
         """Display plan summary statistics."""
@@ -339,45 +467,68 @@ class LogisticsDisplay:
         console.print(target_table)
     
     @staticmethod
-    def display_plan_execution_detailed(plan_result, title: str = "Detailed Plan Execution"):
-        """Display plan execution with detailed action analysis."""
+    def display_plan_execution_detailed(plan_result, title: str = "Detailed Plan Execution", problem: Problem = None,
+                                        show_load: bool = False):
+        """
+        Display plan execution with detailed action analysis.
+        
+        When the problem is given, container weights are read from its initial
+        state; without it they fall back to the tricky weight challenge's naming
+        (c1=2t, others 4t). show_load adds a Load column with each robot's
+        weight after the step, which replays the plan with UP's sequential
+        simulator.
+        """
         if not plan_result or not plan_result.plan:
             console.print(f"[red]❌ {title}: No plan found[/red]")
             return
         
+        states = _replay_plan(problem, plan_result.plan) if problem is not None and show_load else None
+        
         plan_table = Table(title=f"📋 {title}", show_header=True, header_style="bold green")
         plan_table.add_column("Step", style="cyan", justify="center", width=4)
         plan_table.add_column("Action", style="white", width=10)
         plan_table.add_column("Robot", style="yellow", width=4)
-        plan_table.add_column("Details", style="green", width=30)
-        plan_table.add_column("Purpose", style="blue", width=25)
+        # Details and Purpose give up the Load column's width, so the table is no wider with it
+        plan_table.add_column("Details", style="green", width=27 if states is not None else 30)
+        plan_table.add_column("Purpose", style="blue", width=22 if states is not None else 25)
         plan_table.add_column("Weight", style="red", width=8)
-        
-        for i, action in enumerate(plan_result.plan.actions, 1):
-            action_name = action.action.name
-            params = [str(p) for p in action.actual_parameters]
+        if problem is not None:
+            # Resolved once per table rather than by name on every step
+            container_weights = _level_fluents(problem, "container_weight", _CONTAINER_WEIGHTS)
+            object_named = problem.object
+        if states is not None:
+            plan_table.add_column("Load", style="magenta", width=5)
+            robot_weights = _level_fluents(problem, "robot_weight", _ROBOT_WEIGHTS)
+        
+        # Robot -> rendered load; only pickup and putdown change it, so moves reuse the last value
+        loads: Dict[str, str] = {}
+        for i, step in enumerate(plan_steps(plan_result.plan), 1):
+            action_name = step.name
+            params = step.params
+            details, purpose = format_step(step, "redistribution")
+            robot_param = params[0] if params else "?"
             
-            if action_name == "move":
-                robot_param, from_dock, to_dock = params
-                details = f"{robot_param}: {from_dock} → {to_dock}"
-                purpose = "Navigate to target location"
-                weight = "N/A"
-            elif action_name == "pickup":
-                robot_param, container, pile, dock = params
-                details = f"{robot_param} picks {container} from {pile} at {dock}"
-                purpose = f"Collect {container} for redistribution"
-                # Extract weight from container name (assuming c1=2t, c2-c5=4t)
-                weight = "2t" if "c1" in container else "4t"
-            elif action_name == "putdown":
-                robot_param, container, pile, dock = params
-                details = f"{robot_param} puts {container} on {pile} at {dock}"
-                purpose = f"Deliver {container} to target pile"
-                weight = "2t" if "c1" in container else "4t"
+            if action_name in ("pickup", "putdown"):
+                if problem is not None:
+                    # Container weights never change, so the initial state has them
+                    weight = _level(problem.initial_value, container_weights, object_named(params[1]))
+                else:
+                    # Extract weight from container name (assuming c1=2t, c2-c5=4t)
+                    weight = "2t" if "c1" in params[1] else "4t"
             else:
-                details = ", ".join(params)
-                purpose = "Execute action"
                 weight = "N/A"
             
-            plan_table.add_row(str(i), action_name, params[0] if params else "?", details, purpose, weight)
+            if states is not None:
+                state = states[i]
+                if not params:
+                    load = "?"
+                elif action_name == "move" and robot_param in loads and state is not None:
+                    load = loads[robot_param]
+                else:
+                    value_of = state.get_value if state is not None else None
+                    load = loads[robot_param] = _level(value_of, robot_weights, object_named(robot_param))
+                plan_table.add_row(str(i), action_name, robot_param, details, purpose, weight, load)
+            else:
+                plan_table.add_row(str(i), action_name, robot_param, details, purpose, weight)
         
         console.print(plan_table)
\ No newline at end of file
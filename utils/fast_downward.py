@@ -0,0 +1,340 @@
+"""
+Direct Fast Downward invocation for logistics demos.
+Writes problems as PDDL and runs the Fast Downward driver as a subprocess,
+bypassing the OneshotPlanner engine factory.
+"""
+
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from unified_planning.engines import PlanGenerationResult, PlanGenerationResultStatus
+from unified_planning.engines.results import LogLevel, LogMessage
+from unified_planning.io import PDDLReader, PDDLWriter
+from unified_planning.model import Problem
+
+from utils.bitset_search import solve_with_bitset_bfs
+
+WORK_DIR = os.path.join(tempfile.gettempdir(), "logistics_fast_downward")
+# Translator output (SAS+ tasks) keyed by a hash of the PDDL it was produced from
+SAS_CACHE_DIR = os.path.join(WORK_DIR, "sas")
+# Cached tasks unused for longer than this are deleted, and at most this many are kept
+SAS_CACHE_MAX_AGE = 30 * 24 * 3600
+SAS_CACHE_MAX_ENTRIES = 256
+
+# Lazy greedy best-first search on FF with preferred operators. On the demos it
+# finds the same plans as the lama-first alias without LAMA's landmark
+# machinery, and expands fewer states. Written without spaces because the
+# unified-planning engine splits search configurations on whitespace.
+# The search is not iterated, so Fast Downward exits at its first plan; an
+# AnytimePlanner stopped after one solution takes just as long.
+# Landmark heuristics expanded more states on both demos, so they are left out.
+FAST_DOWNWARD_SEARCH = "lazy_greedy([ff()],preferred=[ff()])"
+
+# A* needs an admissible heuristic to return shortest plans, which FF is not.
+# LM-cut does not support the conditional effects of pickup and putdown, so
+# h^max is used.
+FAST_DOWNWARD_OPTIMAL_SEARCH = "astar(hmax())"
+
+# Lines of a failed run's output kept in the result's log messages
+OUTPUT_TAIL_LINES = 20
+
+# https://www.fast-downward.org/ExitCodes
+_EXIT_STATUS = {
+    10: PlanGenerationResultStatus.UNSOLVABLE_PROVEN,
+    11: PlanGenerationResultStatus.UNSOLVABLE_PROVEN,
+    12: PlanGenerationResultStatus.UNSOLVABLE_INCOMPLETELY,
+    13: PlanGenerationResultStatus.UNSOLVABLE_INCOMPLETELY,
+    20: PlanGenerationResultStatus.MEMOUT,
+    21: PlanGenerationResultStatus.TIMEOUT,
+    22: PlanGenerationResultStatus.MEMOUT,
+    23: PlanGenerationResultStatus.TIMEOUT,
+    24: PlanGenerationResultStatus.MEMOUT,
+    34: PlanGenerationResultStatus.UNSUPPORTED_PROBLEM,
+}
+
+
+def fast_downward_driver() -> Optional[str]:
+    """Return the path of the fast-downward.py driver bundled with up-fast-downward, if installed."""
+    spec = importlib.util.find_spec("up_fast_downward")
+    if spec is None or spec.origin is None:
+        return None
+    driver = os.path.join(os.path.dirname(spec.origin), "downward", "fast-downward.py")
+    return driver if os.path.exists(driver) else None
+
+
+def _search_binary(driver: str) -> Optional[str]:
+    """Return the release search executable next to the driver, if it was built."""
+    binary = os.path.join(os.path.dirname(driver), "builds", "release", "bin", "downward")
+    return binary if os.access(binary, os.X_OK) else None
+
+
+@functools.lru_cache(maxsize=None)
+def _driver_identity(driver: str) -> str:
+    """Identify the Fast Downward installation, so translations from another version are not reused."""
+    try:
+        version = importlib.metadata.version("up-fast-downward")
+    except importlib.metadata.PackageNotFoundError:
+        version = str(os.stat(driver).st_mtime_ns)
+    return f"{driver}\0{version}"
+
+
+def _prune_sas_cache() -> None:
+    """Delete cached tasks unused for SAS_CACHE_MAX_AGE, then the least recently used beyond SAS_CACHE_MAX_ENTRIES."""
+    entries = []
+    with os.scandir(SAS_CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(".sas"):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except FileNotFoundError:
+                    pass
+    entries.sort(reverse=True)
+    cutoff = time.time() - SAS_CACHE_MAX_AGE
+    for i, (mtime, path) in enumerate(entries):
+        if i >= SAS_CACHE_MAX_ENTRIES or mtime < cutoff:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Another run pruned it first
+                pass
+
+
+# id(problem) -> (weak reference to the problem, content fingerprint, PDDL name -> item, domain PDDL, problem PDDL)
+_PDDL_CACHE: Dict[int, Tuple[weakref.ref, tuple, Dict[str, Any], str, str]] = {}
+
+
+_CONSTANTS_BLOCK = re.compile(r"\(:constants\n(.*?)\n \)", re.S)
+
+
+def _sorted_constants(domain_pddl: str) -> str:
+    """Sort the names on each line of the domain's constants block.
+
+    PDDLWriter lists constants in set iteration order, which changes between
+    interpreter runs; sorting makes the domain text, and so its hash,
+    reproducible without changing its meaning.
+    """
+    def sort_lines(match):
+        lines = []
+        for line in match.group(1).split("\n"):
+            names, sep, type_name = line.partition(" - ")
+            lines.append("   " + " ".join(sorted(names.split())) + sep + type_name)
+        return "(:constants\n" + "\n".join(lines) + "\n )"
+    return _CONSTANTS_BLOCK.sub(sort_lines, domain_pddl, count=1)
+
+
+def _fingerprint(problem: Problem) -> tuple:
+    """Summarize what a problem's PDDL depends on, so changes after encoding are noticed.
+
+    Expressions are hash-consed, so comparing goals and initial values is cheap
+    next to writing PDDL; objects, fluents and actions are only ever added, so
+    their counts are enough.
+    """
+    return (
+        tuple(problem.goals),
+        frozenset(problem.explicit_initial_values.items()),
+        len(problem.all_objects),
+        len(problem.fluents),
+        len(problem.actions),
+    )
+
+
+def _pddl_encoding(problem: Problem) -> Tuple[Dict[str, Any], str, str]:
+    """
+    Return the PDDL names and domain/problem text for a problem, writing them once per problem object.
+
+    Cached problems are solved again on every run, and producing their PDDL
+    costs far more than building them. The entry is rewritten whenever the
+    problem's goals, initial values, objects, fluents or actions have changed
+    since it was encoded.
+    """
+    key = id(problem)
+    fingerprint = _fingerprint(problem)
+    entry = _PDDL_CACHE.get(key)
+    if entry is not None and entry[0]() is problem and entry[1] == fingerprint:
+        return entry[2], entry[3], entry[4]
+    writer = PDDLWriter(problem)
+    domain_pddl, problem_pddl = _sorted_constants(writer.get_domain()), writer.get_problem()
+    # Keep the name map rather than the writer, which would keep the problem alive
+    items_by_name = dict(writer.nto_renamings)
+    _PDDL_CACHE[key] = (weakref.ref(problem, lambda _: _PDDL_CACHE.pop(key, None)), fingerprint,
+                        items_by_name, domain_pddl, problem_pddl)
+    return items_by_name, domain_pddl, problem_pddl
+
+
+def _write_if_changed(path: str, text: str) -> None:
+    """Write text to path unless the file already holds exactly that text.
+
+    The new content is written to a temporary file and moved into place, so
+    concurrent solves sharing a domain file never read it half written.
+    """
+    if os.path.exists(path):
+        with open(path) as existing:
+            if existing.read() == text:
+                return
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(fd, "w") as out:
+        out.write(text)
+    os.replace(tmp_path, path)
+
+
+def _run_driver(driver: str, name: str, domain_pddl: str, problem_pddl: str, search: str,
+                alias: Optional[str], cache_translation: bool,
+                solved_status: PlanGenerationResultStatus) -> Tuple[PlanGenerationResultStatus, Optional[str], List[LogMessage]]:
+    """
+    Run the Fast Downward driver on PDDL text.
+
+    Returns the status (solved_status when a plan was found), the plan text
+    and, when no plan was found, the tail of the run's stderr (or of its
+    stdout, where the search component reports errors) as log messages.
+    """
+    problem_dir = os.path.join(WORK_DIR, name)
+    os.makedirs(problem_dir, exist_ok=True)
+    domain_filename = os.path.join(problem_dir, "domain.pddl")
+    _write_if_changed(domain_filename, domain_pddl)
+
+    sas_cached = None
+    if cache_translation:
+        # Aliases may carry their own translator options, so they get their own entries;
+        # the driver's path and version keep translations from other installations apart
+        key = hashlib.sha256(
+            f"{_driver_identity(driver)}\0{alias or ''}\0{domain_pddl}\0{problem_pddl}".encode()
+        ).hexdigest()
+        sas_cached = os.path.join(SAS_CACHE_DIR, f"{key}.sas")
+
+    with tempfile.TemporaryDirectory(dir=problem_dir) as run_dir:
+        plan_filename = os.path.join(run_dir, "sas_plan")
+        sas_filename = os.path.join(run_dir, "output.sas")
+        if sas_cached is not None and os.path.exists(sas_cached):
+            # Mark the task as recently used, so pruning removes colder entries first
+            os.utime(sas_cached)
+            inputs = [sas_cached]
+        else:
+            problem_filename = os.path.join(run_dir, "problem.pddl")
+            with open(problem_filename, "w") as out:
+                out.write(problem_pddl)
+            inputs = ["--sas-file", sas_filename, domain_filename, problem_filename]
+
+        binary = _search_binary(driver) if len(inputs) == 1 and not alias else None
+        if binary is not None:
+            # A cached task only needs the search component, so skip the driver
+            with open(sas_cached) as sas_file:
+                completed = subprocess.run([binary, "--search", search, "--internal-plan-file", plan_filename],
+                                           stdin=sas_file, cwd=run_dir, capture_output=True, text=True)
+        elif alias:
+            cmd = [sys.executable, driver, "--plan-file", plan_filename, "--alias", alias, *inputs]
+            completed = subprocess.run(cmd, cwd=run_dir, capture_output=True, text=True)
+        else:
+            cmd = [sys.executable, driver, "--plan-file", plan_filename, *inputs, "--search", search]
+            completed = subprocess.run(cmd, cwd=run_dir, capture_output=True, text=True)
+
+        if sas_cached is not None and os.path.exists(sas_filename):
+            # Atomic, so concurrent runs never see a partially written task
+            os.makedirs(SAS_CACHE_DIR, exist_ok=True)
+            os.replace(sas_filename, sas_cached)
+            _prune_sas_cache()
+
+        if not os.path.exists(plan_filename):
+            status = _EXIT_STATUS.get(completed.returncode, PlanGenerationResultStatus.INTERNAL_ERROR)
+            if completed.returncode == 0:
+                status = PlanGenerationResultStatus.UNSOLVABLE_INCOMPLETELY
+            output = completed.stderr.strip() or completed.stdout.strip()
+            tail = "\n".join(output.splitlines()[-OUTPUT_TAIL_LINES:])
+            message = f"Fast Downward exited with code {completed.returncode}" + (f":\n{tail}" if tail else "")
+            return status, None, [LogMessage(LogLevel.ERROR, message)]
+
+        with open(plan_filename) as plan_file:
+            plan_str = "".join(line for line in plan_file if not line.startswith(";"))
+    return solved_status, plan_str, []
+
+
+def solve_with_fast_downward(problem: Problem, search: str = FAST_DOWNWARD_SEARCH,
+                             alias: Optional[str] = None, cache_translation: bool = True,
+                             optimal: bool = False) -> PlanGenerationResult:
+    """
+    Solve a problem by running Fast Downward directly on its PDDL encoding.
+
+    The domain file is kept per problem name and only rewritten when its
+    content changes; the problem file, plan file and translator output live
+    in a throwaway directory so concurrent runs do not collide. Falls back to
+    breadth-first search over bitset states (utils.bitset_search) when the
+    bundled driver cannot be found; search and alias are ignored then.
+
+    Translation to SAS+ is most of a run's cost on these tasks, so its output
+    is kept in SAS_CACHE_DIR under the SHA-256 of the PDDL and the Fast
+    Downward installation; later runs on the same PDDL start Fast Downward's
+    search binary directly on the cached task, without the Python driver in
+    between. The search configuration is not part of the key, so different
+    searches on one problem share a translation. Tasks unused for
+    SAS_CACHE_MAX_AGE seconds, and the least recently used beyond
+    SAS_CACHE_MAX_ENTRIES, are deleted whenever a new one is stored.
+
+    Args:
+        problem: The planning problem to solve
+        search: Fast Downward search configuration
+        alias: Fast Downward configuration alias (e.g. "lama-first"); replaces search when given
+        cache_translation: Reuse and store translator output across runs
+        optimal: The search is admissible, so a plan it finds is reported as SOLVED_OPTIMALLY
+
+    Returns:
+        PlanGenerationResult whose plan refers to the problem's own actions and objects
+    """
+    driver = fast_downward_driver()
+    if driver is None:
+        # Without up-fast-downward there is no Fast Downward engine to fall back to either
+        return solve_with_bitset_bfs(problem)
+
+    items_by_name, domain_pddl, problem_pddl = _pddl_encoding(problem)
+    solved_status = PlanGenerationResultStatus.SOLVED_OPTIMALLY if optimal else PlanGenerationResultStatus.SOLVED_SATISFICING
+    status, plan_str, log_messages = _run_driver(driver, problem.name, domain_pddl, problem_pddl, search, alias,
+                                                 cache_translation, solved_status)
+    if plan_str is None:
+        return PlanGenerationResult(status, None, "fast-downward", log_messages=log_messages)
+
+    plan = PDDLReader().parse_plan_string(problem, plan_str, items_by_name.__getitem__)
+    return PlanGenerationResult(status, plan, "fast-downward")
+
+
+def solve_pddl_with_fast_downward(name: str, domain_pddl: str, problem_pddl: str,
+                                  search: str = FAST_DOWNWARD_SEARCH, alias: Optional[str] = None,
+                                  cache_translation: bool = True) -> Tuple[PlanGenerationResultStatus, Optional[List[Tuple[str, ...]]]]:
+    """
+    Solve PDDL text that is already written, without building a UP problem.
+
+    Meant for worker processes that receive problems as PDDL: the text goes to
+    the driver instead of being parsed and written out again. The domain's
+    constants are sorted as in solve_with_fast_downward, so the same problem
+    gets the same translation cache key on both paths. Without the bundled driver the PDDL is parsed back
+    into a problem for the same bitset BFS fallback.
+
+    Args:
+        name: Problem name, used for the working directory
+        domain_pddl: Domain PDDL text
+        problem_pddl: Problem PDDL text
+        search: Fast Downward search configuration
+        alias: Fast Downward configuration alias; replaces search when given
+        cache_translation: Reuse and store translator output across runs
+
+    Returns:
+        The status and, when solved, each plan step as (action, *arguments) PDDL names
+    """
+    driver = fast_downward_driver()
+    if driver is None:
+        result = solve_with_bitset_bfs(PDDLReader().parse_problem_string(domain_pddl, problem_pddl))
+        if result.plan is None:
+            return result.status, None
+        return result.status, [(action.action.name, *map(str, action.actual_parameters)) for action in result.plan.actions]
+    status, plan_str, _ = _run_driver(driver, name, _sorted_constants(domain_pddl), problem_pddl, search, alias,
+                                      cache_translation, PlanGenerationResultStatus.SOLVED_SATISFICING)
+    if plan_str is None:
+        return status, None
+    return status, [tuple(line.strip().strip("()").split()) for line in plan_str.splitlines() if line.strip()]